@@ -2,12 +2,15 @@ package org.apache.commons.fileupload;
 
 import java.io.BufferedWriter;
 import java.io.File;
+import java.io.FileOutputStream;
 import java.io.FileWriter;
 import java.io.IOException;
+import java.io.OutputStreamWriter;
 import java.lang.reflect.Constructor;
 import java.lang.reflect.Field;
 import java.lang.reflect.Method;
 import java.lang.reflect.Modifier;
+import java.nio.charset.StandardCharsets;
 import java.security.CodeSource;
 import java.util.ArrayList;
 import java.util.Arrays;
@@ -18,6 +21,8 @@ import java.util.Map;
 import java.util.regex.Pattern;
 import java.util.stream.Collectors;
 import java.util.Set;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.LinkedBlockingQueue;
 
 import org.aspectj.lang.ProceedingJoinPoint;
 import org.aspectj.lang.annotation.Around;
@@ -46,6 +51,32 @@ public class LoggingAspect {
     public static String currentTestClass;
     public static String currentTestMethod;
     public static Set processedMethods = new HashSet<String>();
+
+    // FIFO read by log_collector.py; when set, logs are streamed there instead of written to <test>.log files
+    private static final String LOG_SINK = System.getenv("MOCK_LOG_SINK");
+    private static BufferedWriter sinkWriter;
+    private static boolean sinkFailed = false;
+
+    // <test>.log writers kept open for the duration of their test, closed at the next test and at JVM shutdown
+    private static final int LOG_BUFFER_SIZE = 1 << 16;
+    private static final Map<String, BufferedWriter> logWriters = new HashMap<>();
+
+    // MOCK_LOG_ASYNC=1: messages are written by a background thread, off the tests' threads
+    private static final boolean ASYNC_LOGGING = "1".equals(System.getenv("MOCK_LOG_ASYNC"))
+            || "true".equalsIgnoreCase(System.getenv("MOCK_LOG_ASYNC"));
+    private static final String[] CLOSE_LOG_WRITERS = new String[0];
+    private static final String[] STOP_LOGGING = new String[0];
+    private static final BlockingQueue<String[]> logQueue = new LinkedBlockingQueue<>();
+    private static volatile Thread logThread;
+
+    static {
+        if (ASYNC_LOGGING) {
+            logThread = new Thread(LoggingAspect::runLogWriter, "mock-log-writer");
+            logThread.setDaemon(true);
+            logThread.start();
+        }
+        Runtime.getRuntime().addShutdownHook(new Thread(LoggingAspect::shutdownLogging));
+    }
     
     @Pointcut("execution(* org.apache.commons.fileupload..*(..)) && " +
             "!execution(* org.apache.commons.fileupload..*Test.*(..)) && " +
@@ -159,6 +190,7 @@ public class LoggingAspect {
         if (!testMethodBeingProcessed.equals(previousTestMethod)) {
             markPreviousMethodProcessed();
             previousTestMethod = testMethodBeingProcessed;
+            closeLogWriters();
         }
         if (processingJUnitLifecycleMethod()) {
             if (methodProcessed()) {
@@ -353,20 +385,127 @@ public class LoggingAspect {
     }
 
     private static void appendToLogFile(String logMessage) {
+        String testName = findLastTestMethodInStackTrace(Thread.currentThread().getStackTrace());
+        if (testName == null) return;
+        if (logThread != null) {
+            logQueue.add(new String[] {testName, logMessage});
+        } else {
+            writeLog(testName, logMessage);
+        }
+    }
+
+    private static synchronized void writeLog(String testName, String logMessage) {
+        if (LOG_SINK != null && appendToSink(testName, logMessage)) return;
         try {
-            String testName = findLastTestMethodInStackTrace(Thread.currentThread().getStackTrace());
-            if (testName == null) return;
-    
-            File logFile = new File(testName + ".log");
-            try (BufferedWriter writer = new BufferedWriter(new FileWriter(logFile, true))) {
-                writer.write(logMessage);
-                writer.newLine();
+            BufferedWriter writer = logWriters.get(testName);
+            if (writer == null) {
+                writer = new BufferedWriter(new FileWriter(new File(testName + ".log"), true), LOG_BUFFER_SIZE);
+                logWriters.put(testName, writer);
             }
+            writer.write(logMessage);
+            writer.newLine();
         } catch (IOException e) {
             System.err.println("Logging failed: " + e.getMessage());
         }
     }
 
+    /**
+     * Flushes and closes the open log writers, at the end of a test. With MOCK_LOG_ASYNC, this is queued
+     * behind the messages already logged so that the writer thread closes the files once they are written.
+     */
+    private static void closeLogWriters() {
+        Thread writerThread = logThread;
+        if (writerThread != null && Thread.currentThread() != writerThread) {
+            logQueue.add(CLOSE_LOG_WRITERS);
+            return;
+        }
+        synchronized (LoggingAspect.class) {
+            for (Map.Entry<String, BufferedWriter> entry : logWriters.entrySet()) {
+                try {
+                    entry.getValue().close();
+                } catch (IOException e) {
+                    System.err.println("Closing " + entry.getKey() + ".log failed: " + e.getMessage());
+                }
+            }
+            logWriters.clear();
+            if (sinkWriter != null) {
+                try {
+                    sinkWriter.flush();
+                } catch (IOException e) {
+                    System.err.println("Flushing log sink failed: " + e.getMessage());
+                }
+            }
+        }
+    }
+
+    private static void runLogWriter() {
+        try {
+            while (true) {
+                String[] entry = logQueue.take();
+                if (entry == STOP_LOGGING) return;
+                if (entry == CLOSE_LOG_WRITERS) {
+                    closeLogWriters();
+                } else {
+                    writeLog(entry[0], entry[1]);
+                }
+            }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        }
+    }
+
+    private static void shutdownLogging() {
+        if (logThread != null) {
+            logQueue.add(STOP_LOGGING);
+            try {
+                logThread.join();
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+            logThread = null;
+        }
+        closeLogWriters();
+        closeSink();
+    }
+
+    /**
+     * Streams a log message to the MOCK_LOG_SINK FIFO as "testName\tline" records, one per line of the message.
+     * Records are flushed after each END marker, the point where the collector can mock a call.
+     * Returns false if the sink cannot be opened, in which case messages go to the log files instead.
+     */
+    private static synchronized boolean appendToSink(String testName, String logMessage) {
+        if (sinkFailed) return false;
+        try {
+            if (sinkWriter == null) {
+                sinkWriter = new BufferedWriter(new OutputStreamWriter(new FileOutputStream(LOG_SINK, true), StandardCharsets.UTF_8));
+            }
+            for (String line : logMessage.split("\n", -1)) {
+                sinkWriter.write(testName);
+                sinkWriter.write('\t');
+                sinkWriter.write(line);
+                sinkWriter.newLine();
+            }
+            if (logMessage.startsWith("==========END OF ")) {
+                sinkWriter.flush();
+            }
+            return true;
+        } catch (IOException e) {
+            System.err.println("Log sink failed, logging to files: " + e.getMessage());
+            sinkFailed = true;
+            return false;
+        }
+    }
+
+    private static synchronized void closeSink() {
+        if (sinkWriter == null) return;
+        try {
+            sinkWriter.close();
+        } catch (IOException e) {
+            System.err.println("Closing log sink failed: " + e.getMessage());
+        }
+        sinkWriter = null;
+    }
+
     public static String findLastTestClassInStackTrace(StackTraceElement[] stackTrace) {
         Pattern testClassPattern = Pattern.compile(".*(Test|TestCase)$");
 
@@ -0,0 +1,139 @@
+import ast
+import importlib
+import json
+import os
+import sys
+
+
+SOURCE_FOLDER = "src"
+INDEX_FILE = ".class_registry_index.json"
+INDEX_VERSION = 1
+GENERATED_TEST_MARKER = "_decomposed_mocker_"
+
+resolved_classes = {}
+class_index = None
+
+
+def scan_classes(file_path: str) -> list:
+    """
+    Return the names of the classes defined at the top level of a Python file.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            tree = ast.parse(file.read(), filename=file_path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    return [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+
+
+def build_index(root: str) -> dict:
+    """
+    Map every module under `root`/src to the classes it defines.
+
+    Per-file results are persisted in `root`/.class_registry_index.json and
+    reused while the file's mtime is unchanged, so only edited modules are
+    parsed again. Generated mocker tests are skipped: they define nothing
+    other modules refer to.
+
+    Args:
+        root (str): Project directory containing the `src` package.
+
+    Returns:
+        dict: "files" maps relative paths to [mtime_ns, module name, class names].
+    """
+    index_path = os.path.join(root, INDEX_FILE)
+    try:
+        with open(index_path, "r") as file:
+            cached = json.load(file)
+        if cached.get("version") != INDEX_VERSION:
+            cached = {}
+    except (OSError, ValueError):
+        cached = {}
+    cached_files = cached.get("files", {})
+
+    files = {}
+    changed = False
+    for dir_path, dir_names, file_names in os.walk(os.path.join(root, SOURCE_FOLDER)):
+        dir_names[:] = [d for d in dir_names if d != "__pycache__"]
+        for file_name in file_names:
+            if not file_name.endswith(".py") or GENERATED_TEST_MARKER in file_name:
+                continue
+            file_path = os.path.join(dir_path, file_name)
+            rel_path = os.path.relpath(file_path, root)
+            mtime_ns = os.stat(file_path).st_mtime_ns
+            entry = cached_files.get(rel_path)
+            if entry is None or entry[0] != mtime_ns:
+                module_name = rel_path[:-len(".py")].replace(os.sep, ".")
+                if module_name.endswith(".__init__"):
+                    module_name = module_name[:-len(".__init__")]
+                entry = [mtime_ns, module_name, scan_classes(file_path)]
+                changed = True
+            files[rel_path] = entry
+    if changed or len(files) != len(cached_files):
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as file:
+                json.dump({"version": INDEX_VERSION, "files": files}, file)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return {"files": files}
+
+
+def load_index() -> dict:
+    """
+    Load the class index for the project in the current directory once per process.
+
+    Returns:
+        dict: "classes" maps qualified class names to their module, "modules" is
+        the set of every module name under `src`.
+    """
+    global class_index
+    if class_index is None:
+        root = os.getcwd()
+        if root not in sys.path:
+            sys.path.insert(0, root)
+        classes = {}
+        modules = set()
+        for _, module_name, class_names in build_index(root)["files"].values():
+            modules.add(module_name)
+            for class_name in class_names:
+                classes[f"{module_name}.{class_name}"] = module_name
+        class_index = {"classes": classes, "modules": modules}
+    return class_index
+
+
+def resolve_class(name: str):
+    """
+    Resolve a qualified name such as "src.main.org.apache.X.X" to a class,
+    importing only the module it lives in.
+
+    Names the generated code used to look up in `globals()` after importing the
+    whole tree resolve to the same classes, including classes a module merely
+    imports. Results (including misses) are cached for the life of the process.
+
+    Args:
+        name (str): Module path followed by the class name.
+
+    Returns:
+        type: The class, or None if `name` is not a class under `src`.
+    """
+    if name in resolved_classes:
+        return resolved_classes[name]
+    clazz = None
+    if name and "." in name:
+        index = load_index()
+        module_name = index["classes"].get(name)
+        if module_name is None:
+            module_name = name.rsplit(".", 1)[0]
+        if module_name in index["modules"]:
+            try:
+                module = importlib.import_module(module_name)
+                clazz = getattr(module, name[len(module_name) + 1:], None)
+            except Exception:
+                clazz = None
+            if not isinstance(clazz, type):
+                clazz = None
+    resolved_classes[name] = clazz
+    return clazz
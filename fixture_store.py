@@ -0,0 +1,91 @@
+import gzip
+import json
+
+from instrumentation import count_bytes
+
+
+FIXTURE_SUFFIX = "_fixtures.jsonl"
+loaded_stores = {}
+
+
+def open_store(path: str, mode: str):
+    """
+    Open a fixture store as text, transparently handling gzip-compressed stores.
+
+    Args:
+        path (str): Path to the store; stores ending in `.gz` are compressed.
+        mode (str): "r", "w" or "a".
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class FixtureWriter:
+    """
+    Write the serialized payloads referenced by every workflow of one log into
+    a single store of `key<TAB>compact json` lines. Keys are the content hashes
+    assigned by log_parser.PayloadTable, so each distinct object is written once
+    no matter how many tests use it.
+
+    Args:
+        path (str): Path of the store to create.
+        payloads (log_parser.PayloadTable): Table the keys were taken from.
+        append (bool): Whether to add to an existing store instead.
+    """
+    def __init__(self, path: str, payloads, append=False):
+        self.path = path
+        self.payloads = payloads
+        self.file = open_store(path, "a" if append else "w")
+        self.written = set()
+
+    def add(self, key) -> str:
+        """
+        Make sure the payload behind `key` is in the store and return its key.
+        A key of None (a value that was not logged) is stored as JSON null.
+        """
+        if key is None:
+            key = self.payloads.add("null")
+        if key not in self.written:
+            self.written.add(key)
+            line = f"{key}\t{self.payloads.raw(key)}\n"
+            count_bytes("fixture_store", len(line))
+            self.file.write(line)
+        return key
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_store(path: str) -> dict:
+    """
+    Read a fixture store once per process, keeping payloads as undecoded JSON text.
+    """
+    store = loaded_stores.get(path)
+    if store is None:
+        store = {}
+        with open_store(path, "r") as file:
+            for line in file:
+                key, raw = line.rstrip("\n").split("\t", 1)
+                store[key] = raw
+        loaded_stores[path] = store
+    return store
+
+
+def load_fixture(path: str, key: str):
+    """
+    Decode one payload from a fixture store.
+
+    A fresh object is returned on every call, so tests may freely mutate it.
+
+    Args:
+        path (str): Path to the fixture store written for the log.
+        key (str): Key of the payload within the store.
+    """
+    return json.loads(load_store(path)[key])
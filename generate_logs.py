@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 import argparse
+import errno
 import json
+import math
 import os
+import queue
 import signal
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+import traceback
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Union
 from subprocess import CalledProcessError, TimeoutExpired
@@ -28,6 +35,7 @@ def run_cmd(
     *,
     timeout: int = 100,
     run_script: bool = False,
+    env: dict | None = None,
 ) -> None:
     """
     Launch Maven or our script via a small .sh wrapper, to reduce Python-side variability.
@@ -53,6 +61,7 @@ def run_cmd(
         cwd=cwd,
         start_new_session=True,
         stdin=subprocess.DEVNULL,  # we never need to send ENTER
+        env=env,
     )
 
     try:
@@ -88,19 +97,596 @@ def ensure_sdk(java_version: str = "8.0.432-kona") -> None:
     os.environ["JAVA_HOME"] = str(java_candidate)
     os.environ["PATH"] = str(java_candidate / "bin") + os.pathsep + os.environ.get("PATH", "")
 
-def copy_project_tree(project: str) -> None:
-    """Re-create a fresh working copy of the Java project."""
+# Paths our patchers (modify_pom.py, add_java_files.py) rewrite in place; they
+# must be real copies, since writing through a hardlink would alter the source.
+COPIED_PATHS = ("pom.xml", "src/test")
+COPIED_NAMES = ("LoggingAspect.java", "CustomToStringConverter.java")
+
+def is_copied(rel_path: Path) -> bool:
+    rel = rel_path.as_posix()
+    return rel_path.name in COPIED_NAMES or any(rel == p or rel.startswith(p + "/") for p in COPIED_PATHS)
+
+def sync_file(src: Path, dst: Path, copy: bool) -> None:
+    """Bring one file of a working copy up to date, hardlinking it unless `copy` is set."""
+    if dst.exists() or dst.is_symlink():
+        if copy:
+            src_stat, dst_stat = src.stat(), dst.stat()
+            if (src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+                    and src_stat.st_ino != dst_stat.st_ino):
+                return
+        elif os.path.samefile(src, dst):
+            return
+        if dst.is_dir() and not dst.is_symlink():
+            shutil.rmtree(dst)
+        else:
+            dst.unlink()
+    if not copy:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # e.g. another filesystem: fall back to copying
+    shutil.copy2(src, dst)
+
+def copy_project_tree(project: str, dst: Path | None = None) -> None:
+    """
+    Make `dst` (by default the project's own name) a fresh working copy of the
+    Java project. Files our patchers never modify are hardlinked to the source,
+    the others copied; on re-runs only files whose source changed (or that were
+    patched) are replaced, and files missing from the source are removed.
+    """
     src = Path("../AlphaTransDev/java_projects/cleaned_final_projects") / project
-    dst = Path(project)
-    if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(src, dst)
+    dst = Path(project) if dst is None else dst
+    if dst.is_symlink() or dst.is_file():
+        dst.unlink()
+    dst.mkdir(exist_ok=True)
+
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel_dir = Path(dirpath).relative_to(src)
+        for dirname in dirnames:
+            target = dst / rel_dir / dirname
+            if target.is_symlink() or target.is_file():
+                target.unlink()
+            target.mkdir(exist_ok=True)
+        for filename in filenames:
+            sync_file(Path(dirpath) / filename, dst / rel_dir / filename, is_copied(rel_dir / filename))
+
+    # drop whatever the source does not have (patcher output, build output, logs)
+    for dirpath, dirnames, filenames in os.walk(dst, topdown=False):
+        rel_dir = Path(dirpath).relative_to(dst)
+        for name in filenames + dirnames:
+            if not (src / rel_dir / name).exists():
+                target = Path(dirpath) / name
+                if target.is_dir() and not target.is_symlink():
+                    shutil.rmtree(target)
+                else:
+                    target.unlink()
+
+def prepare_project(project: str, java_dir: Path | None = None) -> Path:
+    """Create a working copy of the Java project with our POM and source patches applied."""
+    java_dir = Path(project) if java_dir is None else java_dir
+    copy_project_tree(project, java_dir)
+
+    # inject our patchers
+    for helper in ("modify_pom.py", "add_java_files.py"):
+        shutil.copy(helper, java_dir)
+
+    # apply POM & source patches
+    run(["python3", "modify_pom.py"], cwd=java_dir)
+    run(["python3", "add_java_files.py"], cwd=java_dir)
+
+    # clean out any stale logs
+    clean_logs(java_dir)
+    return java_dir
+
+COMPACT_EVERY = 500
+
+# Maven timeouts (seconds) derived from the durations of mocked methods
+DEFAULT_TIMEOUT = 100
+MIN_TIMEOUT = 60
+MAX_TIMEOUT = 900
+TIMEOUT_PERCENTILE = 95
+TIMEOUT_FACTOR = 2.0
+MIN_SAMPLES = 5
+MAX_BATCH_TIMEOUT = 1800
+
+def fsync_dir(directory: Path) -> None:
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class StateJournal:
+    """
+    The executed_tests state of a project: the JSON snapshot
+    executed_tests/<project>.json plus an append-only journal of per-method
+    updates (executed_tests/<project>.journal.jsonl), one fsynced JSON line each.
+
+    Loading replays the journal left by an interrupted run over the snapshot,
+    ignoring a line torn by a crash. On load, every COMPACT_EVERY updates and
+    when closed, the state is compacted: written to a temporary snapshot that
+    atomically replaces the old one, after which the journal is emptied.
+    Updates are safe to make from several workers.
+
+    Args:
+        project (str): Project name.
+    """
+    def __init__(self, project: str):
+        self.path = Path("executed_tests") / f"{project}.json"
+        self.journal_path = Path("executed_tests") / f"{project}.journal.jsonl"
+        self.lock = threading.Lock()
+        self.executed_tests = json.loads(self.path.read_text())
+        self.replay()
+        self.journal = open(self.journal_path, "a")
+        # start from an empty journal, so nothing is appended after a torn line
+        self.compact()
+
+    def replay(self) -> None:
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # torn last write
+                info = self.executed_tests.get(entry.pop("class"), {}).get(entry.pop("method"))
+                if info is not None:
+                    info.update(entry)
+
+    def record(self, test_class: str, test_method: str, **fields) -> None:
+        """Update the state of one test method and journal the change."""
+        with self.lock:
+            self.executed_tests[test_class][test_method].update(fields)
+            self.journal.write(json.dumps({"class": test_class, "method": test_method, **fields}) + "\n")
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+            self.updates += 1
+            if self.updates >= COMPACT_EVERY:
+                self.compact()
+
+    def compact(self) -> None:
+        """Write a full snapshot and empty the journal (callers hold the lock)."""
+        tmp_path = self.path.with_suffix(f".json.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.executed_tests, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        fsync_dir(self.path.parent)
+        # a crash before this point only replays updates the snapshot already has
+        self.journal.truncate(0)
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+        self.updates = 0
+
+    def close(self) -> None:
+        with self.lock:
+            self.compact()
+            self.journal.close()
+        self.journal_path.unlink()
+
+def java_test_class(test_class: str) -> str:
+    """Fix up the class name if it starts with "Test" (TestFoo -> FooTest)."""
+    parts = test_class.split(".")
+    if parts[-1].startswith("Test"):
+        parts[-1] = parts[-1][4:] + "Test"
+    return ".".join(parts)
+
+def clean_logs(directory: Path) -> None:
+    for p in directory.glob("*.log"):
+        p.unlink()
+
+def is_generated_test_file(path: Path) -> bool:
+    return "_decomposed_mocker_" in path.name or "_fixtures.jsonl" in path.name
+
+def method_files(paths: list[Path], test_class: str, test_methods: set[str]) -> list[Path]:
+    """The mocked tests and fixture stores among `paths` generated for the given methods of a test class."""
+    class_name = java_test_class(test_class).rsplit(".", 1)[-1]
+    prefixes = tuple(prefix for test_method in test_methods
+                     for prefix in (f"{class_name}_{test_method}_decomposed_mocker_",
+                                    f"{class_name}_{test_method}_fixtures.jsonl"))
+    return [path for path in paths if path.name.startswith(prefixes)]
+
+def surefire_report(java_dir: Path, test_class: str) -> Path:
+    return java_dir / "target" / "surefire-reports" / f"TEST-{java_test_class(test_class)}.xml"
 
-def save_state(project: str, executed_tests: dict) -> None:
-    """Atomically write out our JSON state."""
-    path = Path("executed_tests") / f"{project}.json"
-    with open(path, "w") as f:
-        json.dump(executed_tests, f, indent=4)
+def surefire_failures(report: Path) -> set[str] | None:
+    """Test methods that failed or errored according to a surefire report, None without a report."""
+    try:
+        root = ET.parse(report).getroot()
+    except (OSError, ET.ParseError):
+        return None
+    failures = set()
+    for test in root.iter("testcase"):
+        if test.find("failure") is not None or test.find("error") is not None:
+            failures.add(test.get("name", "").split("(")[0].split("[")[0])
+    return failures
+
+SERVER_GRACE = 30  # seconds a script.py server may take beyond a log's timeout to report it
+
+class ScriptServer:
+    """
+    A `script.py --serve` process in a Python project, started on first use and
+    kept for the whole run, so that each log is mocked in a process forked from
+    it instead of a new interpreter importing all the helpers again.
+
+    Args:
+        py_dir (Path): Python project the logs are mocked in.
+        jobs (int): Number of logs mocked concurrently.
+        timeout (int): Seconds after which the mocking of one log is killed.
+    """
+    def __init__(self, py_dir: Path, jobs: int = 2, timeout: int = 100):
+        self.py_dir = py_dir
+        self.jobs = jobs
+        self.timeout = timeout
+        self.proc = None
+        self.results = None
+        self.reported = set()
+
+    def read_results(self, proc: subprocess.Popen, results: queue.Queue) -> None:
+        for line in proc.stdout:
+            results.put(line)
+        results.put("")
+
+    def mock(self, log_files: list[Path]) -> None:
+        """
+        Mock the given logs of the project, echoing the result of each. Raises
+        TimeoutError, after killing the server, if no result comes within the
+        timeout of a log (while logs are queued, one always ends within it).
+        The names of the logs that got a result are kept in `reported`.
+        """
+        self.reported = set()
+        if self.proc is None or self.proc.poll() is not None:
+            cmd = ["python3", "script.py", "--serve", "--jobs", str(self.jobs), "--timeout", str(self.timeout)]
+            print(f"Running command: {cmd}")
+            self.proc = subprocess.Popen(cmd, cwd=self.py_dir, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         text=True, start_new_session=True)
+            self.results = queue.Queue()
+            threading.Thread(target=self.read_results, args=(self.proc, self.results), daemon=True).start()
+        for log_file in log_files:
+            self.proc.stdin.write(f"{log_file.name}\n")
+        self.proc.stdin.flush()
+        for _ in log_files:
+            try:
+                line = self.results.get(timeout=self.timeout + SERVER_GRACE)
+            except queue.Empty:
+                self.kill()
+                raise TimeoutError("script.py --serve stopped answering")
+            if not line:
+                raise BrokenPipeError("script.py --serve exited")
+            print(line.rstrip())
+            self.reported.add(line.split()[1])
+
+    def kill(self) -> None:
+        os.killpg(self.proc.pid, signal.SIGKILL)
+        self.proc.wait()
+        self.proc = None
+
+    def close(self) -> None:
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=self.timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+        self.proc = None
+
+HELPERS = ("mock_helper.py", "log_parser.py", "script.py", "replay.py", "result_cache.py", "fixture_store.py",
+           "class_registry.py", "type_registry.py", "instrumentation.py", "log_collector.py")
+SINK_NAME = "mock_logs.fifo"
+
+def install_helpers(py_dir: Path) -> None:
+    py_dir.mkdir(exist_ok=True)
+    for helper in HELPERS:
+        shutil.copy(helper, py_dir)
+    shutil.copytree("type_maps", py_dir / "type_maps", dirs_exist_ok=True)
+
+def snapshot_generated_files(py_dir: Path) -> dict[Path, tuple[int, int]]:
+    """(st_mtime_ns, st_size) of the mocked tests and fixture stores of the Python project."""
+    snapshot = {}
+    for path in (py_dir / "src" / "test").rglob("*"):
+        if path.is_file() and is_generated_test_file(path):
+            stat = path.stat()
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+def generated_files(py_dir: Path, before: dict[Path, tuple[int, int]]) -> list[Path]:
+    """
+    Mocked tests and fixture stores of the Python project created or rewritten
+    since the snapshot `before` was taken. File timestamps are not compared to
+    the clock, which may be ahead of the filesystem's coarser ones.
+    """
+    return [path for path, stat in snapshot_generated_files(py_dir).items() if before.get(path) != stat]
+
+def mock_logs(workspace: dict, before: dict[Path, tuple[int, int]] | None = None) -> set[str]:
+    """
+    Move the logs of the last Maven run into the Python project and generate
+    the mocked tests from them, through the workspace's script.py server if it
+    has one. A worker's Python copy has the shared Python project as
+    "merge_into", which receives the files generated since the snapshot
+    `before` (by default, taken by this call).
+
+    Returns:
+        set: Tests ("<class>.<method>") whose logs were mocked.
+    """
+    java_dir, py_dir, merge_into = workspace["java_dir"], workspace["py_dir"], workspace["merge_into"]
+    script = workspace.get("script")
+    if before is None and merge_into is not None:
+        before = snapshot_generated_files(py_dir)
+
+    # 6. Collect any new .log files into our python dir
+    py_dir.mkdir(exist_ok=True)
+    for log_path in java_dir.glob(f"*.log"):
+        shutil.copy(log_path, py_dir)
+
+    # 7. Copy over mock helpers
+    install_helpers(py_dir)
+
+    # 8. Generate mocks from each log
+    log_files = list(py_dir.glob(f"*.log"))
+    logged = {log_file.name[:-len(".log")] for log_file in log_files}
+    if script is not None and log_files:
+        try:
+            script.mock(log_files)
+            log_files = []
+        except OSError:
+            # the server died: restart it next time, mock the logs it did not report one by one
+            script.close()
+            log_files = [log_file for log_file in log_files if log_file.name not in script.reported]
+    for log_file in log_files:
+        try:
+            run_cmd("", log_file, py_dir, run_script=True)
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            pass
+
+    if merge_into is not None:
+        for path in generated_files(py_dir, before):
+            target = merge_into / path.relative_to(py_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, target)
+
+    # 9. Clean up logs (and their parser indexes) everywhere
+    clean_logs(py_dir)
+    for p in py_dir.glob("*.log.idx"):
+        p.unlink()
+    clean_logs(java_dir)
+    return logged
+
+def stop_collector(sink: Path, collector: subprocess.Popen, timeout: int) -> None:
+    """
+    End a log collector's input with an empty record, wait for it to finish
+    mocking and remove the FIFO. The record is written without blocking, so a
+    collector that has died (or never opened the FIFO) cannot hang us.
+    """
+    while collector.poll() is None:
+        try:
+            fd = os.open(sink, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as e:
+            if e.errno != errno.ENXIO:
+                raise
+            time.sleep(0.05)  # still starting up
+            continue
+        try:
+            os.write(fd, b"\n")
+        finally:
+            os.close(fd)
+        break
+    try:
+        collector.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        collector.kill()
+        collector.wait()
+    sink.unlink()
+
+def run_tests(workspace: dict, test_class: str, test_methods: list[str], timeout: int) -> tuple[set[str], set[str]]:
+    """
+    Run test methods with Maven and mock the calls they logged. When tests
+    fail, surefire's report tells which: what they logged is dropped and the
+    others are mocked as usual. A timeout, or a failed build that no failed
+    test explains, is raised as by run_cmd, after dropping what the tests
+    logged.
+
+    When the workspace streams, the tests send their logs to a FIFO read by
+    log_collector.py, which mocks each call while Maven is still running; logs
+    written to files instead (if the aspect could not open the FIFO) are
+    mocked afterwards as usual.
+
+    Returns:
+        tuple: (methods whose logs were mocked, methods whose tests failed).
+    """
+    java_dir, py_dir = workspace["java_dir"], workspace["py_dir"]
+    report = surefire_report(java_dir, test_class)
+    report.unlink(missing_ok=True)
+    stream = workspace.get("stream")
+    before = env = None
+    if stream:
+        before = snapshot_generated_files(py_dir)
+        install_helpers(py_dir)
+        sink = (py_dir / SINK_NAME).resolve()
+        if sink.exists():
+            sink.unlink()
+        os.mkfifo(sink)
+        # not a pipe: nobody reads it while the tests run
+        collector_output = tempfile.TemporaryFile("w+")
+        collector = subprocess.Popen(["python3", "log_collector.py", SINK_NAME], cwd=py_dir, stdout=collector_output)
+        env = dict(os.environ, MOCK_LOG_SINK=str(sink))
+
+    failed = set()
+    try:
+        run_cmd(java_test_class(test_class), "+".join(test_methods), java_dir, timeout=timeout, env=env)
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+        if isinstance(e, subprocess.CalledProcessError):
+            failed = (surefire_failures(report) or set()) & set(test_methods)
+        if not failed:
+            if stream:
+                stop_collector(sink, collector, timeout)
+                collector_output.close()
+                for path in generated_files(py_dir, before):
+                    path.unlink()
+            clean_logs(java_dir)
+            raise
+
+    logged = set()
+    if stream:
+        stop_collector(sink, collector, timeout)
+        collector_output.seek(0)
+        for line in collector_output:
+            if line.endswith(" workflows mocked\n"):
+                logged.add(line.rpartition(": ")[0])
+        collector_output.close()
+        for path in method_files(generated_files(py_dir, before), test_class, failed):
+            path.unlink()
+    for test_method in failed:
+        for log_path in java_dir.glob(f"*.{test_method}.log"):
+            log_path.unlink()
+    logged |= mock_logs(workspace, before)
+    mocked = {test_name.rsplit(".", 1)[-1] for test_name in logged} & set(test_methods)
+    return mocked - failed, failed
+
+def run_method(state: StateJournal, workspace: dict, test_class: str, test_method: str,
+               timeout: int = DEFAULT_TIMEOUT) -> None:
+    """
+    Run one test method on its own and mock the calls it logged. A run that
+    exceeds `timeout` is marked "timeout" (with the limit it had), a failed
+    build or test "failed", so neither is retried endlessly.
+    """
+    start = time.time()
+    try:
+        _, failed = run_tests(workspace, test_class, [test_method], timeout)
+    except subprocess.TimeoutExpired:
+        state.record(test_class, test_method, timeout=True, timeout_limit=timeout,
+                     mock_duration=time.time() - start)
+        return
+    except subprocess.CalledProcessError:
+        failed = {test_method}
+    if failed:
+        state.record(test_class, test_method, failed=True, mock_duration=time.time() - start)
+        return
+
+    state.record(test_class, test_method, mocked=True, timeout=False, mock_duration=time.time() - start)
+
+def run_batch(state: StateJournal, workspace: dict, test_class: str, batch: list[str],
+              timeouts: list[int], timeout: int) -> None:
+    """
+    Run several methods of one test class in a single Maven invocation
+    (surefire's `Class#m1+m2` selector), within `timeout` (see batch_timeout).
+    LoggingAspect names each log after its test method, so the methods whose
+    logs were mocked are marked done. Their equal share of the batch's duration
+    is kept as "batch_duration", apart from the "mock_duration" measured for
+    methods run alone, which the timeouts are derived from.
+
+    Methods that failed or logged nothing are then run one by one, as are all
+    of them if the batch times out or the build fails without a failed test.
+    """
+    start = time.time()
+    try:
+        mocked, _ = run_tests(workspace, test_class, batch, timeout)
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
+        mocked = set()
+
+    share = (time.time() - start) / len(batch)
+    for test_method, method_timeout in zip(batch, timeouts):
+        if test_method in mocked:
+            state.record(test_class, test_method, mocked=True, timeout=False, batch_duration=share)
+        else:
+            run_method(state, workspace, test_class, test_method, method_timeout)
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    values = sorted(values)
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+def plan_methods(executed_tests: dict, pending: list[tuple[str, str]]) -> dict:
+    """
+    Estimate the duration of the pending test methods and pick their timeouts
+    from the durations of the methods already mocked.
+
+    A method's estimate is its own last duration if it has one (a timed-out
+    method being retried), else the median of its test class, else of the
+    project. Its timeout is TIMEOUT_FACTOR times the larger of its estimate and
+    the TIMEOUT_PERCENTILE-th percentile of its class (or of the project, for
+    classes with fewer than MIN_SAMPLES mocked methods), bounded by MIN_TIMEOUT
+    and MAX_TIMEOUT. A retried method gets at least twice its previous limit.
+    Without any history, the timeout is DEFAULT_TIMEOUT.
+
+    Returns:
+        dict: (test class, test method) -> (estimated seconds, timeout).
+    """
+    class_durations = {
+        test_class: [info["mock_duration"] for info in methods.values()
+                     if info.get("mocked") and info.get("mock_duration")]
+        for test_class, methods in executed_tests.items()
+    }
+    project_durations = [d for durations in class_durations.values() for d in durations]
+
+    plan = {}
+    for test_class, test_method in pending:
+        info = executed_tests[test_class][test_method]
+        durations = class_durations[test_class]
+        if len(durations) < MIN_SAMPLES:
+            durations = project_durations
+        if not durations:
+            estimate, timeout = info.get("mock_duration") or 0.0, DEFAULT_TIMEOUT
+        else:
+            estimate = info.get("mock_duration") or percentile(durations, 50)
+            limit = TIMEOUT_FACTOR * max(estimate, percentile(durations, TIMEOUT_PERCENTILE))
+            timeout = int(min(MAX_TIMEOUT, max(MIN_TIMEOUT, limit)))
+        if info.get("timeout"):
+            timeout = min(MAX_TIMEOUT, max(timeout, 2 * info.get("timeout_limit", DEFAULT_TIMEOUT)))
+        plan[(test_class, test_method)] = (estimate, timeout)
+    return plan
+
+def batch_timeout(estimates: list[float], timeouts: list[int]) -> int:
+    """
+    Timeout of a batch of methods: TIMEOUT_FACTOR times the sum of their
+    estimated durations, no less than the timeout of any of them alone, and at
+    most MAX_BATCH_TIMEOUT, so that a hung batch soon falls back to running its
+    methods one by one.
+    """
+    return int(min(MAX_BATCH_TIMEOUT, max(max(timeouts), TIMEOUT_FACTOR * sum(estimates))))
+
+def create_worker_workspace(project: str, py_dir: Path, worker: int, script_jobs: int, stream: bool) -> dict:
+    """
+    Give a worker its own patched Java project and Python project copies, so
+    concurrent Maven runs and mock generation never share logs or outputs.
+    """
+    java_dir = prepare_project(project, Path(f"{project}-worker{worker}"))
+    worker_py_dir = Path(f"{py_dir}-worker{worker}")
+    if worker_py_dir.exists():
+        shutil.rmtree(worker_py_dir)
+    if py_dir.exists():
+        shutil.copytree(py_dir, worker_py_dir, ignore=shutil.ignore_patterns("__pycache__", "*.log", "*.log.idx", SINK_NAME))
+    script = ScriptServer(worker_py_dir, script_jobs) if script_jobs else None
+    return {"java_dir": java_dir, "py_dir": worker_py_dir, "merge_into": py_dir, "script": script, "stream": stream}
+
+def run_jobs(state: StateJournal, workspace: dict, jobs: queue.Queue, errors: list) -> None:
+    """
+    Take jobs from the shared queue until it is empty. A job that fails
+    unexpectedly is reported and added to `errors`, unrecorded, so that its
+    methods are pending again on the next run; the worker goes on.
+    """
+    while True:
+        try:
+            job = jobs.get_nowait()
+        except queue.Empty:
+            return
+        test_class, batch, timeouts, timeout = job
+        try:
+            if timeout is not None and len(batch) > 1:
+                run_batch(state, workspace, test_class, batch, timeouts, timeout)
+            else:
+                run_method(state, workspace, test_class, batch[0], timeouts[0])
+        except Exception:
+            print(f"Running {test_class}#{'+'.join(batch)} failed:", file=sys.stderr)
+            traceback.print_exc()
+            errors.append(job)
+
+def exit_on_errors(errors: list) -> None:
+    if errors:
+        sys.exit(f"{len(errors)} jobs failed unexpectedly and were left pending, see the errors above")
 
 # ───────────────────────── main workflow ──────────────────────────
 
@@ -109,97 +695,96 @@ def main() -> None:
         description="Generate mocks from AlphaTrans build logs (Python port)."
     )
     parser.add_argument("project", help="Project directory name")
+    parser.add_argument("--batch", action="store_true",
+                        help="Run the methods of a test class together in one Maven invocation")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="Maximum number of methods per Maven invocation in batch mode (default: whole class)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of parallel workers, each with its own copy of the Java and Python projects")
+    parser.add_argument("--script-jobs", type=int, default=2,
+                        help="Logs mocked concurrently by each persistent script.py server (0: one script.py run per log)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream the logs of the tests to log_collector.py, mocking them while Maven runs")
+    parser.add_argument("--retry-timeouts", action="store_true",
+                        help="Run timed-out methods again, with at least twice their previous timeout")
     args = parser.parse_args()
 
     project = args.project
-    state_path = Path("executed_tests") / f"{project}.json"
-    executed_tests = json.loads(state_path.read_text())
+    state = StateJournal(project)
+    executed_tests = state.executed_tests
 
     # 1.  Activate the right Java once
     ensure_sdk("8.0.432-kona")
 
-    # reset project
-    copy_project_tree(project)
-
-    # inject our patchers
-    for helper in ("modify_pom.py", "add_java_files.py"):
-        shutil.copy(helper, project)
-
-    # apply POM & source patches
-    run(["python3", "modify_pom.py"], cwd=Path(project))
-    run(["python3", "add_java_files.py"], cwd=Path(project))
-
-    # clean out any stale logs
-    for p in Path(project).glob("*.log"):
-        p.unlink()
-
     py_dir = Path(f"{project}-python")
 
-    # For each test class, we start from a _fresh_ workspace:
+    # ensure keys, skip already-done, failed or timed-out methods
+    pending = []
     for test_class, methods in executed_tests.items():
-
-        # now run each test method
         for test_method, info in methods.items():
-
-            # ensure keys
             info.setdefault("mocked", False)
             info.setdefault("timeout", False)
+            info.setdefault("failed", False)
             info.setdefault("mock_duration", None)
-
-            # skip already-done or timed-out
-            if info["mocked"] or info["timeout"]:
-                continue
-
-            start = time.time()
-            # fix up class name if it ends with "Test…"
-            parts = test_class.split(".")
-            if parts[-1].startswith("Test"):
-                parts[-1] = parts[-1][4:] + "Test"
-            actual_class = ".".join(parts)
-
-            try:
-                run_cmd(actual_class, test_method, Path(project))
-            except subprocess.TimeoutExpired:
-                info["timeout"] = True
-                info["mock_duration"] = time.time() - start
-                save_state(project, executed_tests)
-                for p in Path(project).glob("*.log"):
-                    p.unlink()
-                continue
-            except subprocess.CalledProcessError:
-                # build failure—mark as timeout so we don't retry endlessly
-                info["timeout"] = True
-                info["mock_duration"] = time.time() - start
-                save_state(project, executed_tests)
-                for p in Path(project).glob("*.log"):
-                    p.unlink()
-                continue
-
-            # 6. Collect any new .log files into our python dir
-            py_dir.mkdir(exist_ok=True)
-            for log_path in Path(project).glob(f"*.log"):
-                shutil.copy(log_path, py_dir)
-
-            # 7. Copy over mock helpers
-            for helper in ("mock_helper.py", "log_parser.py", "script.py"):
-                shutil.copy(helper, py_dir)
-
-            # 8. Generate mocks from each log
-            for log_file in py_dir.glob(f"*.log"):
-                try:
-                    run_cmd("", log_file, py_dir, run_script=True)
-                except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-                    pass
-
-            # 9. Clean up logs everywhere
-            for p in py_dir.glob("*.log"):
-                p.unlink()
-            for p in Path(project).glob("*.log"):
-                p.unlink()
-
-            info["mocked"] = True
-            info["mock_duration"] = time.time() - start
-            save_state(project, executed_tests)
+            retry = args.retry_timeouts and info["timeout"] and info.get("timeout_limit", DEFAULT_TIMEOUT) < MAX_TIMEOUT
+            if not (info["mocked"] or info["failed"] or info["timeout"]) or retry:
+                pending.append((test_class, test_method))
+    plan = plan_methods(executed_tests, pending)
+
+    # Queue the pending test methods (or batches of methods of one class),
+    # longest first, so the slowest work does not end up last on one worker
+    work = []
+    if args.batch:
+        by_class = {}
+        for test_class, test_method in pending:
+            by_class.setdefault(test_class, []).append(test_method)
+        for test_class, class_methods in by_class.items():
+            class_methods.sort(key=lambda m: plan[(test_class, m)][0], reverse=True)
+            batch_size = args.batch_size or len(class_methods)
+            for i in range(0, len(class_methods), batch_size):
+                batch = class_methods[i:i + batch_size]
+                timeouts = [plan[(test_class, m)][1] for m in batch]
+                estimates = [plan[(test_class, m)][0] for m in batch]
+                work.append((test_class, batch, timeouts, batch_timeout(estimates, timeouts)))
+    else:
+        for test_class, test_method in pending:
+            work.append((test_class, [test_method], [plan[(test_class, test_method)][1]], None))
+    work.sort(key=lambda job: sum(plan[(job[0], m)][0] for m in job[1]), reverse=True)
+    jobs = queue.Queue()
+    for job in work:
+        jobs.put(job)
+    errors = []
+
+    if args.workers <= 1:
+        # reset project, in place
+        java_dir = prepare_project(project)
+        script = ScriptServer(py_dir, args.script_jobs) if args.script_jobs else None
+        workspace = {"java_dir": java_dir, "py_dir": py_dir, "merge_into": None, "script": script, "stream": args.stream}
+        run_jobs(state, workspace, jobs, errors)
+        if script is not None:
+            script.close()
+        state.close()
+        exit_on_errors(errors)
+        return
+
+    # Each worker gets isolated copies and pulls from the shared queue; the
+    # shared Python project only receives their tests, so it needs the helpers too
+    install_helpers(py_dir)
+    workspaces = [create_worker_workspace(project, py_dir, worker, args.script_jobs, args.stream)
+                  for worker in range(args.workers)]
+    threads = [threading.Thread(target=run_jobs, args=(state, workspace, jobs, errors))
+               for workspace in workspaces]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for workspace in workspaces:
+        if workspace["script"] is not None:
+            workspace["script"].close()
+        shutil.rmtree(workspace["java_dir"], ignore_errors=True)
+        shutil.rmtree(workspace["py_dir"], ignore_errors=True)
+    state.close()
+    exit_on_errors(errors)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,227 @@
+import atexit
+import functools
+import inspect
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+ENV_VAR = "MOCK_PIPELINE_PROFILE"
+DEFAULT_REPORT = "mock_pipeline_profile.jsonl"
+
+profiler = None
+
+
+class Profiler:
+    """
+    Per-phase wall time, call counts, payload bytes and peak traced memory of
+    the mocking pipeline, reported as one JSON line per log.
+
+    Re-entrant phases (convert_to_python calls itself) count every call but only
+    time their outermost one. Peak memory is the highest `tracemalloc` total seen
+    while a phase was running, nested phases included.
+
+    Args:
+        report_path (str): JSONL file the records are appended to.
+    """
+    def __init__(self, report_path):
+        self.report_path = report_path
+        self.stack = []
+        self.depth = {}
+        self.phases = {}
+        self.log = None
+        self.log_start = None
+        self.log_peak = 0
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stats(self, name) -> dict:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = {"calls": 0, "seconds": 0.0, "bytes": 0, "peak_memory": 0}
+            self.phases[name] = stats
+        return stats
+
+    def fold_peak(self):
+        """
+        Credit the traced memory peak since the last fold to every running phase.
+        """
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self.stack:
+            frame[1] = max(frame[1], peak)
+        self.log_peak = max(self.log_peak, peak)
+        tracemalloc.reset_peak()
+
+    def enter(self, name, count=True):
+        """
+        Start a call of a phase. Returns whether it is the outermost one.
+        """
+        if count:
+            self.stats(name)["calls"] += 1
+        depth = self.depth.get(name, 0)
+        self.depth[name] = depth + 1
+        if depth:
+            return False
+        self.fold_peak()
+        self.stack.append([name, 0, time.perf_counter()])
+        return True
+
+    def exit(self, name, outermost):
+        self.depth[name] -= 1
+        if not outermost:
+            return
+        self.fold_peak()
+        _, peak, start = self.stack.pop()
+        stats = self.stats(name)
+        stats["seconds"] += time.perf_counter() - start
+        stats["peak_memory"] = max(stats["peak_memory"], peak)
+
+    def add_bytes(self, name, size):
+        self.stats(name)["bytes"] += size
+
+    def start_log(self, log_path):
+        self.flush()
+        self.log = log_path
+        self.log_start = time.perf_counter()
+        tracemalloc.reset_peak()
+        self.log_peak = tracemalloc.get_traced_memory()[0]
+
+    def flush(self):
+        """
+        Append the record of the current log (if anything was measured) and reset.
+        """
+        if not self.phases:
+            return
+        self.fold_peak()
+        record = {
+            "log": self.log,
+            "pid": os.getpid(),
+            "argv": sys.argv,
+            "seconds": time.perf_counter() - self.log_start if self.log_start is not None else None,
+            "peak_memory": self.log_peak,
+            "phases": self.phases,
+        }
+        with open(self.report_path, "a") as file:
+            file.write(json.dumps(record) + "\n")
+        self.phases = {}
+        self.log = None
+        self.log_start = None
+
+
+def enable(report_path=None):
+    """
+    Turn instrumentation on for the rest of the process.
+
+    Args:
+        report_path (str): JSONL report; defaults to the MOCK_PIPELINE_PROFILE
+            environment variable when it names a file, else mock_pipeline_profile.jsonl.
+    """
+    global profiler
+    if profiler is None:
+        if report_path is None:
+            report_path = os.environ.get(ENV_VAR, "")
+            if report_path in ("", "1"):
+                report_path = DEFAULT_REPORT
+        profiler = Profiler(report_path)
+        atexit.register(profiler.flush)
+    return profiler
+
+
+def instrumented(name):
+    """
+    Decorator recording every call of a function as phase `name`. Generator
+    functions are timed while they produce items. When instrumentation is off
+    the only cost is one check per call.
+    """
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if profiler is None:
+                    yield from func(*args, **kwargs)
+                    return
+                profiler.stats(name)["calls"] += 1
+                items = func(*args, **kwargs)
+                while True:
+                    outermost = profiler.enter(name, count=False)
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        return
+                    finally:
+                        profiler.exit(name, outermost)
+                    yield item
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if profiler is None:
+                return func(*args, **kwargs)
+            outermost = profiler.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.exit(name, outermost)
+        return wrapper
+    return decorator
+
+
+def count_bytes(name, size):
+    """
+    Add `size` payload bytes to phase `name`, if instrumentation is on.
+    """
+    if profiler is not None:
+        profiler.add_bytes(name, size)
+
+
+@contextmanager
+def log_scope(log_path):
+    """
+    Attribute everything measured inside the block to one log.
+    """
+    if profiler is None:
+        yield
+        return
+    profiler.start_log(log_path)
+    try:
+        yield
+    finally:
+        profiler.flush()
+
+
+def aggregate(report_paths) -> dict:
+    """
+    Sum the per-log records of one or more reports, per phase.
+
+    Returns:
+        dict: "logs", "seconds", "peak_memory" (max over logs) and "phases",
+        with the totals (max for peak_memory) of every phase.
+    """
+    summary = {"logs": 0, "seconds": 0.0, "peak_memory": 0, "phases": {}}
+    for report_path in report_paths:
+        with open(report_path, "r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                summary["logs"] += 1
+                summary["seconds"] += record.get("seconds") or 0.0
+                summary["peak_memory"] = max(summary["peak_memory"], record.get("peak_memory", 0))
+                for name, stats in record["phases"].items():
+                    total = summary["phases"].setdefault(name, {"calls": 0, "seconds": 0.0, "bytes": 0, "peak_memory": 0})
+                    total["calls"] += stats["calls"]
+                    total["seconds"] += stats["seconds"]
+                    total["bytes"] += stats["bytes"]
+                    total["peak_memory"] = max(total["peak_memory"], stats["peak_memory"])
+    return summary
+
+
+if os.environ.get(ENV_VAR):
+    enable()
+
+
+if __name__ == "__main__":
+    print(json.dumps(aggregate(sys.argv[1:] or [DEFAULT_REPORT]), indent=4))
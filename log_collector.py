@@ -0,0 +1,133 @@
+import os
+import queue
+import sys
+import threading
+import traceback
+
+from log_parser import PayloadTable, iter_call_events, iter_mock_workflows
+from script import write_mock_tests
+
+
+SINK_ENV_VAR = "MOCK_LOG_SINK"
+MAX_OPEN_STREAMS = 32
+
+
+class TestStream:
+    """
+    The log of one test method, arriving line by line. A thread parses the
+    lines as they come and writes each mocked test as soon as the top-level
+    call it belongs to has ended, exactly as script.py would from the test's
+    `<test>.log` file.
+
+    A stream that is closed and reopened (see collect) continues the numbering
+    of its tests and appends to its fixture store.
+
+    Args:
+        test_name (str): Test method the log belongs to, "<class>.<method>".
+        compress_fixtures (bool): Whether to gzip the fixture store.
+        start_index (int): Number of workflows written by earlier parts of the log.
+    """
+    def __init__(self, test_name, compress_fixtures=False, start_index=0):
+        self.log_path = f"{test_name}.log"
+        self.compress_fixtures = compress_fixtures
+        self.start_index = start_index
+        self.workflows = 0
+        self.payloads = PayloadTable()
+        self.lines = queue.Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def iter_lines(self):
+        while True:
+            line = self.lines.get()
+            if line is None:
+                return
+            yield line
+
+    def iter_workflows(self):
+        events = iter_call_events(self.iter_lines())
+        for mock_workflow in iter_mock_workflows(events, self.payloads):
+            yield self.start_index + self.workflows, mock_workflow
+            self.workflows += 1
+
+    def run(self):
+        try:
+            write_mock_tests(self.log_path, self.iter_workflows(), self.payloads,
+                             self.compress_fixtures, append=self.start_index > 0)
+        except Exception:
+            print(f"Mocking {self.log_path} failed:", file=sys.stderr)
+            traceback.print_exc()
+            for _ in self.iter_lines():
+                pass
+
+    def feed(self, line):
+        self.lines.put(line)
+
+    def close(self) -> int:
+        """
+        Wait for the stream to be processed; returns the number of workflows
+        written so far.
+        """
+        self.lines.put(None)
+        self.thread.join()
+        return self.start_index + self.workflows
+
+
+def collect(records, compress_fixtures=False, max_open_streams=MAX_OPEN_STREAMS) -> dict:
+    """
+    Mock the logs streamed by LoggingAspect to a sink, while they are written.
+
+    Each record is one log line prefixed by the test it belongs to,
+    "<test name>\\t<line>\\n". Records are routed to one TestStream per test; at
+    most `max_open_streams` are open at once, the least recently used one being
+    closed to make room. Collection ends with an empty record.
+
+    Args:
+        records (iterable): Records as bytes.
+        compress_fixtures (bool): Whether to gzip the fixture stores.
+        max_open_streams (int): Maximum number of tests parsed concurrently.
+
+    Returns:
+        dict: Number of workflows mocked, per test.
+    """
+    streams = {}
+    written = {}
+    for record in records:
+        test_name, _, line = record.decode("utf-8").partition("\t")
+        if not test_name.strip():
+            break
+        stream = streams.pop(test_name, None)
+        if stream is None:
+            if len(streams) >= max_open_streams:
+                oldest = next(iter(streams))
+                written[oldest] = streams.pop(oldest).close()
+            stream = TestStream(test_name, compress_fixtures, written.get(test_name, 0))
+        streams[test_name] = stream  # most recently used last
+        stream.feed(line)
+    for test_name, stream in streams.items():
+        written[test_name] = stream.close()
+    return written
+
+
+def read_sink(sink_path):
+    """
+    Read the records written to a FIFO, across writers: when one closes the sink
+    (e.g. a forked test JVM exits), wait for the next one, until an empty record.
+    """
+    while True:
+        with open(sink_path, "rb") as sink:
+            for record in sink:
+                yield record
+                if not record.partition(b"\t")[0].strip():
+                    return
+
+
+if __name__ == "__main__":
+    # python3 log_collector.py <fifo> [--gzip-fixtures]; run the tests with MOCK_LOG_SINK=<fifo>,
+    # then end the collection with an empty record: echo > <fifo>
+    sink_path = sys.argv[1]
+    if not os.path.exists(sink_path):
+        os.mkfifo(sink_path)
+    written = collect(read_sink(sink_path), "--gzip-fixtures" in sys.argv[2:])
+    for test_name, count in written.items():
+        print(f"{test_name}: {count} workflows mocked")
@@ -1,9 +1,83 @@
+import hashlib
+import json
+import mmap
+import os
 import re
+import struct
 import sys
 
+from instrumentation import instrumented, count_bytes
+
+SECTION_PATTERN = re.compile(
+    r'(?:Arg(\d+) (initial|final) state|(Return value|Instance Initial|Instance Final'
+    r'|Static Fields Changed|Static Fields Initial|Exception thrown)): '
+)
+json_decoder = json.JSONDecoder()
+
+
+class PayloadTable:
+    """
+    Content-addressed store of the serialized objects found in a log.
+
+    Every payload is kept once, as its compact JSON text, under a hash of that
+    text; parsed workflows only hold the keys. The receiver of a call is logged
+    again by every nested call on it, so most payloads in a log are repeats.
+    """
+    def __init__(self):
+        self.texts = {}
+
+    def add(self, text: str) -> str:
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+        if key not in self.texts:
+            self.texts[key] = text
+        return key
+
+    def raw(self, key: str) -> str:
+        return self.texts[key]
+
+    def get(self, key: str):
+        return json.loads(self.texts[key])
+
+    def __len__(self):
+        return len(self.texts)
+
+
+def iter_sections(text: str):
+    """
+    Walk the `[Label: payload, Label: payload, ...]` list logged by LoggingAspect
+    and delimit every payload with the C-level JSON decoder.
+
+    Each marker is searched for only after the previous payload ends, so text
+    inside serialized strings is never mistaken for a section marker.
+
+    Yields:
+        tuple: (section, arg_idx, payload_text) where section is e.g. "Args Initial"
+        or "Return value", arg_idx is the argument index for argument sections
+        (None otherwise) and payload_text is the payload's JSON text.
+    """
+    pos = 0
+    while True:
+        match = SECTION_PATTERN.search(text, pos)
+        if not match:
+            return
+        try:
+            _, pos = json_decoder.raw_decode(text, match.end())
+        except json.JSONDecodeError:
+            pos = match.end()
+            continue
+        arg_idx, arg_state, section = match.groups()
+        payload_text = text[match.end():pos]
+        if arg_idx is not None:
+            yield f"Args {arg_state.capitalize()}", arg_idx, payload_text
+        else:
+            yield section, None, payload_text
 
 
-def process_side_effect(line: str) -> dict:
+def process_side_effect(line: str, payloads: PayloadTable) -> dict:
+    """
+    Parse a side-effect line into a method dictionary whose payload sections
+    hold keys into `payloads`.
+    """
     lhs, rhs = line.split(':', 1)
     method_name, modifier = lhs.split("[")
     modifier = modifier.strip()
@@ -13,102 +87,13 @@ def process_side_effect(line: str) -> dict:
         "modifier": modifier
     }
 
-    args_initial = extract_args(rhs, '(Arg\d+)( initial state: )')
-    if args_initial:
-        entry["Args Initial"] = args_initial
-
-    args_final = extract_args(rhs, '(Arg\d+)( final state: )')
-    if args_final:
-        entry["Args Final"] = args_final
-
-    for key in ["Return value", "Instance Initial", "Instance Final", "Static Fields Changed", "Static Fields Initial", "Exception thrown"]:
-        key_match = re.search(f'{key}: (\{{.*\}}|\[.*\])', rhs)
-        if key_match:
-            value = match_json_structure(rhs[key_match.start(1):])
-            if value:
-                entry[key] = value
+    for section, arg_idx, payload_text in iter_sections(rhs):
+        if arg_idx is not None:
+            entry.setdefault(section, []).append((arg_idx, payloads.add(payload_text)))
+        elif section not in entry:
+            entry[section] = payloads.add(payload_text)
     return entry
 
-def extract_args(text, regex):
-    args_initial = []
-
-    for match in re.finditer(regex, text):
-        arg_idx = match.group(1).split("Arg")[1]
-        start = match.end()
-
-        stack = []
-        json_start = None
-        in_quote = None
-        escaped = False
-
-        for i in range(start, len(text)):
-            char = text[i]
-
-            if escaped:
-                escaped = False
-                continue
-
-            if char == "\\":
-                escaped = True
-                continue
-
-            if char in "\"'" and not escaped:
-                if in_quote is None:
-                    in_quote = char
-                elif in_quote == char:
-                    in_quote = None
-
-            elif char == "{" and in_quote is None:
-                if not stack:
-                    json_start = i
-                stack.append(char)
-
-            elif char == "}" and in_quote is None:
-                if stack:
-                    stack.pop()
-                    if not stack:
-                        args_initial.append((arg_idx, text[json_start:i+1]))
-                        break
-
-    return args_initial
-
-def match_json_structure(text):
-    stack = []
-    start_index = None
-    in_quote = None
-    escape = False
-
-    for i, char in enumerate(text):
-        if escape:
-            escape = False
-            continue
-
-        if char == "\\":
-            escape = True
-            continue
-
-        if char in "\"'":
-            if in_quote is None:
-                in_quote = char
-            elif in_quote == char:
-                in_quote = None
-            continue
-
-        if in_quote:
-            continue
-
-        if char in "{[":
-            if not stack:
-                start_index = i
-            stack.append(char)
-        elif char in "}]":
-            if stack:
-                stack.pop()
-                if not stack:
-                    return text[start_index:i+1]
-
-    return None
-
 
 def match_nested_braces(s: str) -> str:
     stack = []
@@ -121,84 +106,232 @@ def match_nested_braces(s: str) -> str:
             return s[:i+1]
     return None
 
-def get_side_effect_and_end_line(start_line_index: int, lines: list) -> list:
-    counter = 1
-    for line_index in range(start_line_index + 1, len(lines)):
-        line = lines[line_index].strip()
-        if line.startswith("==========START OF"):
-            counter += 1
-        elif line.startswith("==========END OF"):
-            counter -= 1
-            if counter == 0:
-                return [process_side_effect(lines[line_index - 1]), line_index]
-
-def parse_logs(input_log_file: str) -> dict:
-    with open(input_log_file, 'r') as file:
-        lines = file.readlines()
-    all_mock_workflows = []
-    for start_line_index in range(len(lines)):
-        start_line = lines[start_line_index].strip()
-        if start_line.startswith("==========START OF"):
-            methods_to_mock = []
-            mock_indices = {}
-            retrieve_mocking_info_for_one_method(methods_to_mock, mock_indices, 0, len(lines) - 1, start_line_index, lines)
-            all_mock_workflows.append(methods_to_mock)
-    return all_mock_workflows
-            
-
-
-def retrieve_mocking_info_for_one_method(methods_to_mock: list, mock_indices: dict, start: int, end: int, method_index: int, lines: list) -> None:
-    chunk_start = start
-    while chunk_start <= end:
-        line = lines[chunk_start].strip()
-        if line.startswith("==========START OF"):
-            method_name = line.split("==========START OF ")[1].split("==========")[0]
-            chunk_side_effect, chunk_end = get_side_effect_and_end_line(chunk_start, lines)
-            if chunk_start == method_index:
-                if not method_name in mock_indices:
-                    mock_indices[method_name] = 0
-                mock_indices[method_name] += 1
-                modifier = lines[chunk_end - 1].split(':', 1)[0].split("[")[1].strip()
-                chunk_side_effect.update({
-                    "occurrence_idx": mock_indices[method_name],
-                    "note": "skip",
-                    "modifier": modifier
-                })
-                methods_to_mock.append(chunk_side_effect)
-                find_mocks_in_call_chain(methods_to_mock, mock_indices, chunk_start + 1, chunk_end - 1, lines)
-                break
-            elif chunk_end < method_index:
-                chunk_start = chunk_end + 1
-            else:
-                chunk_start += 1
+
+START_MARKER = "==========START OF "
+END_MARKER = "==========END OF "
+
+
+def iter_call_events(lines):
+    """
+    Turn raw log lines into a flat stream of call events.
+
+    Yields ("START", method_name, None) for every START marker and
+    ("END", method_name, side_effect_line) for every END marker, where
+    side_effect_line is the line logged right before the END marker.
+    """
+    previous_line = None
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped.startswith(START_MARKER):
+            method_name = stripped.strip()[len(START_MARKER):].split("==========")[0]
+            yield "START", method_name, None
+        elif stripped.startswith(END_MARKER):
+            method_name = stripped.strip()[len(END_MARKER):].split("==========")[0]
+            yield "END", method_name, previous_line
+        previous_line = line
+
+
+def build_mock_workflow(method_name: str, side_effect: dict, children: list) -> list:
+    """
+    Assemble the workflow for one call: the focal method itself (marked "skip")
+    followed by every direct nested call that needs to be mocked.
+    """
+    mock_indices = {method_name: 1}
+    methods_to_mock = [dict(side_effect, occurrence_idx=1, note="skip")]
+    for child_name, child_side_effect in children:
+        mock_indices[child_name] = mock_indices.get(child_name, -1) + 1
+        methods_to_mock.append(dict(child_side_effect, occurrence_idx=mock_indices[child_name]))
+    return methods_to_mock
+
+
+def iter_mock_workflows(events, payloads):
+    """
+    Build the START/END call tree incrementally with a stack and yield one
+    mock workflow per call, in the order the calls were started. Payloads are
+    interned into `payloads`.
+
+    Workflows are buffered only until the enclosing top-level call ends, so
+    memory is bounded by the largest top-level call tree rather than the log.
+    """
+    stack = []
+    pending = []
+    for kind, method_name, side_effect_line in events:
+        if kind == "START":
+            stack.append({"method_name": method_name, "slot": len(pending), "children": []})
+            pending.append(None)
+            continue
+        if not stack:
+            continue
+        frame = stack.pop()
+        if side_effect_line is not None:
+            side_effect = process_side_effect(side_effect_line, payloads)
+            pending[frame["slot"]] = build_mock_workflow(frame["method_name"], side_effect, frame["children"])
+            if stack:
+                stack[-1]["children"].append((frame["method_name"], side_effect))
+        if not stack:
+            yield from (workflow for workflow in pending if workflow is not None)
+            pending.clear()
+    # Calls that never logged their END (e.g. the JVM died mid-test) are dropped.
+    yield from (workflow for workflow in pending if workflow is not None)
+
+
+MARKER_PATTERN = re.compile(rb'^[ \t]*==========(START|END) OF ([^\r\n]*)', re.MULTILINE)
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"LOGIDX1\n"
+INDEX_HEADER = struct.Struct("<QqII")
+INDEX_RECORD = struct.Struct("<QBII")
+KIND_START = 0
+KIND_END = 1
+
+
+def scan_markers(log_map):
+    """
+    Scan a mapped log once for START/END markers.
+
+    Args:
+        log_map (mmap.mmap): The mapped log file.
+
+    Returns:
+        tuple: (names, records) where names is the list of distinct method names
+        and records is a list of (line_offset, kind, depth, name_id) tuples.
+    """
+    names = []
+    name_ids = {}
+    records = []
+    depth = 0
+    for match in MARKER_PATTERN.finditer(log_map):
+        method_name = match.group(2).split(b"==========")[0].rstrip().decode("utf-8")
+        name_id = name_ids.get(method_name)
+        if name_id is None:
+            name_id = name_ids[method_name] = len(names)
+            names.append(method_name)
+        if match.group(1) == b"START":
+            records.append((match.start(), KIND_START, depth, name_id))
+            depth += 1
         else:
-            break
-
-def find_mocks_in_call_chain(methods_to_mock: list, mock_indices: dict, start: int, end: int, lines: list) -> None:
-    chunk_start = start
-    while chunk_start <= end:
-        line = lines[chunk_start].strip()
-        if line.startswith("==========START OF"):
-            method_name = line.split("==========START OF ")[1].split("==========")[0]
-            chunk_side_effect, chunk_end = get_side_effect_and_end_line(chunk_start, lines)
-            if method_name not in mock_indices:
-                mock_indices[method_name] = -1
-            mock_indices[method_name] += 1
-            chunk_side_effect["occurrence_idx"] = mock_indices[method_name]
-            methods_to_mock.append(chunk_side_effect)
-            chunk_start = chunk_end + 1
+            depth = max(depth - 1, 0)
+            records.append((match.start(), KIND_END, depth, name_id))
+    return names, records
+
+
+def write_index(index_file: str, stat, names: list, records: list):
+    """
+    Persist the marker index next to the log, keyed by the log's size and mtime.
+    The file is written to a temporary path and renamed so readers never see a
+    partial index.
+    """
+    names_blob = "\n".join(names).encode("utf-8")
+    tmp_file = f"{index_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "wb") as file:
+            file.write(INDEX_MAGIC)
+            file.write(INDEX_HEADER.pack(stat.st_size, stat.st_mtime_ns, len(names_blob), len(records)))
+            file.write(names_blob)
+            for record in records:
+                file.write(INDEX_RECORD.pack(*record))
+        os.replace(tmp_file, index_file)
+    except OSError:
+        # The index is only an optimization; a read-only log directory is fine.
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def read_index(index_file: str, stat):
+    """
+    Load a marker index if it exists and still matches the log it was built from.
+
+    Returns:
+        tuple: (names, records) as produced by scan_markers, or None when the
+        index is missing, stale or unreadable.
+    """
+    try:
+        with open(index_file, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+    header_end = len(INDEX_MAGIC) + INDEX_HEADER.size
+    if not data.startswith(INDEX_MAGIC) or len(data) < header_end:
+        return None
+    size, mtime_ns, names_len, record_count = INDEX_HEADER.unpack_from(data, len(INDEX_MAGIC))
+    if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+        return None
+    records_start = header_end + names_len
+    if len(data) != records_start + record_count * INDEX_RECORD.size:
+        return None
+    names_blob = data[header_end:records_start].decode("utf-8")
+    names = names_blob.split("\n") if names_blob else []
+    records = list(INDEX_RECORD.iter_unpack(data[records_start:]))
+    return names, records
+
+
+def load_index(input_log_file: str, log_map):
+    """
+    Return the marker index for a log, reusing the sidecar `<log>.idx` file when
+    it is up to date and rebuilding it otherwise.
+    """
+    index_file = input_log_file + INDEX_SUFFIX
+    stat = os.stat(input_log_file)
+    index = read_index(index_file, stat)
+    if index is None:
+        index = scan_markers(log_map)
+        write_index(index_file, stat, *index)
+    return index
+
+
+def line_before(log_map, offset: int) -> str:
+    """
+    Return the line that ends right before the line starting at `offset`.
+    """
+    if offset == 0:
+        return None
+    end = offset - 1
+    start = log_map.rfind(b"\n", 0, end) + 1
+    return log_map[start:offset].decode("utf-8")
+
+
+def iter_indexed_events(log_map, names: list, records: list):
+    """
+    Produce the same event stream as iter_call_events from a marker index,
+    reading only the side-effect line in front of each END marker.
+    """
+    for offset, kind, _, name_id in records:
+        if kind == KIND_START:
+            yield "START", names[name_id], None
         else:
-            break
+            yield "END", names[name_id], line_before(log_map, offset)
 
 
+@instrumented("parse_logs")
+def parse_logs(input_log_file: str, payloads: PayloadTable):
+    """
+    Lazily parse a log file into mock workflows.
 
+    The log is memory-mapped rather than read into memory, and the offsets of
+    its START/END markers are cached in a sidecar `<log>.idx` file, so parsing
+    an unchanged log again only touches the side-effect lines.
 
+    Args:
+        input_log_file (str): Path to the log produced by LoggingAspect.
+        payloads (PayloadTable): Table receiving every serialized object; the
+            payload sections of the yielded method dictionaries are its keys.
 
-             
+    Yields:
+        list: One mock workflow (list of method dictionaries) per logged call.
+    """
+    with open(input_log_file, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        count_bytes("parse_logs", size)
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            names, records = load_index(input_log_file, log_map)
+            yield from iter_mock_workflows(iter_indexed_events(log_map, names, records), payloads)
 
 
 if __name__ == "__main__":
     input_log_file = sys.argv[1]
-    result = parse_logs(input_log_file)
+    payloads = PayloadTable()
+    result = list(parse_logs(input_log_file, payloads))
     import pprint
-    pprint.pprint(result)
\ No newline at end of file
+    pprint.pprint(result)
+    pprint.pprint(payloads.texts)
\ No newline at end of file
@@ -0,0 +1,337 @@
+import os
+import sys
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from mock_helper import update_static_fields, set_object_instance_fields, convert_to_python, recursive_equal, side_effect_is_correct, ObjectArena
+from class_registry import resolve_class, load_index
+from log_parser import parse_logs, PayloadTable
+from script import patched_attribute_name, write_mock_tests
+from result_cache import ResultCache
+from instrumentation import instrumented, enable, log_scope
+
+
+class SideEffect:
+    """
+    Same as the `SideEffect` class defined by every generated test: each call of
+    the mock runs the next logged occurrence.
+    """
+    def __init__(self, *fns):
+        self.fs = iter(fns)
+    def __call__(self, *args, **kwargs):
+        f = next(self.fs)
+        return None if f is None else f(*args, **kwargs)
+
+
+class ReplayFailure(Exception):
+    """
+    A check of the focal method failed (an `assert*` of the generated test).
+    """
+
+
+def focal_class_name(method_name):
+    """
+    Return the "src.main" qualified Python class declaring a logged method.
+    """
+    full_class_name = method_name.rsplit('.', 1)[0]
+    class_name = full_class_name.split('.')[-1].split("$")[-1]
+    if "$" in full_class_name:
+        full_class_name = full_class_name.replace("$", ".")
+    else:
+        full_class_name = full_class_name + "." + class_name
+    return f"src.main.{full_class_name}"
+
+
+def workflow_modules(mock_workflow) -> list:
+    """
+    Return the modules declaring the classes of every method of a workflow.
+    """
+    classes = load_index()["classes"]
+    module_names = set()
+    for method_dict in mock_workflow:
+        class_name = focal_class_name(method_dict.get("method_name", ""))
+        module_names.add(classes.get(class_name, class_name.rsplit(".", 1)[0]))
+    return sorted(module_names)
+
+
+def expect_raises(exception, call, *args):
+    try:
+        call(*args)
+    except type(exception):
+        return
+    raise ReplayFailure(f"{type(exception).__name__} not raised")
+
+
+def check(condition, message):
+    if not condition:
+        raise ReplayFailure(message)
+
+
+class WorkflowReplay:
+    """
+    Run one mock workflow in-process with the semantics of the test script.py
+    would generate for it: every logged method is patched, each call of a patched
+    method replays the next logged occurrence, and the focal method is run for
+    real and checked against the log.
+
+    Args:
+        mock_workflow (list): Method dictionaries of the workflow, focal method first.
+        payloads (PayloadTable): Table holding the payloads the workflow refers to.
+    """
+    def __init__(self, mock_workflow, payloads):
+        self.mock_workflow = mock_workflow
+        self.payloads = payloads
+        self.patch_targets = []
+        self.side_effects = {}
+        self.focal_calls = []
+
+    def load(self, payload_key):
+        """
+        Decode a payload; a value that was not logged is None, like in generated tests.
+        """
+        if payload_key is None:
+            return None
+        return self.payloads.get(payload_key)
+
+    def add_side_effect(self, target, side_effect):
+        if target not in self.side_effects:
+            self.patch_targets.append(target)
+            self.side_effects[target] = []
+        self.side_effects[target].append(side_effect)
+
+    def constructor_side_effect(self, method_dict):
+        def side_effect(*args, **kwargs):
+            if len(args) == 0:
+                return
+            if 'Exception thrown' in method_dict:
+                raise convert_to_python(self.load(method_dict.get('Exception thrown')))
+            if 'Static Fields Changed' in method_dict:
+                update_static_fields(self.load(method_dict.get('Static Fields Changed')))
+            for arg_idx, arg_data in method_dict.get('Args Final', []):
+                set_object_instance_fields(args[int(arg_idx) + 1], self.load(arg_data))
+            if 'Return value' in method_dict:
+                set_object_instance_fields(args[0], self.load(method_dict.get('Return value')))
+        return side_effect
+
+    def method_side_effect(self, method_dict):
+        def apply(instance, args):
+            if 'Exception thrown' in method_dict:
+                raise convert_to_python(self.load(method_dict.get('Exception thrown')))
+            if 'Static Fields Changed' in method_dict:
+                update_static_fields(self.load(method_dict.get('Static Fields Changed')))
+            if 'Instance Final' in method_dict:
+                set_object_instance_fields(instance, self.load(method_dict.get('Instance Final')))
+            for arg_idx, arg_data in method_dict.get('Args Final', []):
+                set_object_instance_fields(args[int(arg_idx)], self.load(arg_data))
+            if 'Return value' in method_dict:
+                return convert_to_python(self.load(method_dict.get('Return value')))
+            return None
+
+        if 'Instance Final' in method_dict:
+            def side_effect(self, *args):
+                return apply(self, args)
+        else:
+            def side_effect(*args):
+                return apply(None, args)
+        return side_effect
+
+    def focal_constructor(self, method_dict):
+        clazz = resolve_class(focal_class_name(method_dict.get("method_name", "")))
+        orig_init = clazz.__init__
+
+        def init_side_effect(*args, **kwargs):
+            try:
+                orig_init(*args, **kwargs)
+            except TypeError as e:
+                if not 'object needs an argument' in str(e):
+                    raise
+
+        def run():
+            if 'Static Fields Initial' in method_dict:
+                update_static_fields(self.load(method_dict.get('Static Fields Initial')))
+            method_args = [convert_to_python(self.load(arg_data)) for _, arg_data in method_dict.get('Args Initial', [])]
+            if issubclass(clazz, BaseException):
+                obj = Exception.__new__(clazz)
+            else:
+                obj = object.__new__(clazz)
+            if 'Exception thrown' in method_dict:
+                expect_raises(convert_to_python(self.load(method_dict.get('Exception thrown'))), orig_init, obj, *method_args)
+            else:
+                orig_init(obj, *method_args)
+                expected = convert_to_python(self.load(method_dict.get('Return value')), force_new_object=True)
+                check(recursive_equal(obj, expected), "constructed object differs")
+            self.check_side_effects(method_dict, method_args)
+
+        return init_side_effect, run
+
+    def focal_method(self, method_dict):
+        method_name = method_dict.get("method_name", "")
+        modifier = method_dict.get("modifier", "")
+        clazz = resolve_class(focal_class_name(method_name))
+        name_base = method_name.split('.')[-1]
+        if name_base == "type" or name_base == "next": # escape Python keyword
+            name_base += "_"
+        class_name = method_name.rsplit('.', 1)[0].split('.')[-1].split("$")[-1]
+        if modifier == "private":
+            attribute_name = f"_{class_name}__{name_base}"
+        elif modifier == "protected":
+            attribute_name = f"_{name_base}"
+        else:
+            attribute_name = name_base
+        orig_method = getattr(clazz, attribute_name)
+        orig_name = f"orig_{class_name}_{name_base}"
+        setattr(clazz, orig_name, orig_method)
+
+        def run():
+            if 'Static Fields Initial' in method_dict:
+                update_static_fields(self.load(method_dict.get('Static Fields Initial')))
+            method_args = [convert_to_python(self.load(arg_data)) for _, arg_data in method_dict.get('Args Initial', [])]
+            if 'Instance Initial' in method_dict:
+                instance_initial = convert_to_python(self.load(method_dict.get('Instance Initial')))
+                call = getattr(instance_initial, orig_name)
+            else:
+                call = orig_method
+            if 'Exception thrown' in method_dict:
+                expect_raises(convert_to_python(self.load(method_dict.get('Exception thrown'))), call, *method_args)
+            else:
+                method_ret = call(*method_args)
+                if 'Return value' in method_dict:
+                    expected = convert_to_python(self.load(method_dict.get('Return value')), force_new_object=True)
+                    check(recursive_equal(method_ret, expected), "return value differs")
+            if 'Instance Final' in method_dict:
+                instance_final = convert_to_python(self.load(method_dict.get('Instance Final')), force_new_object=True)
+                check(recursive_equal(instance_initial, instance_final), "instance state differs")
+            self.check_side_effects(method_dict, method_args)
+
+        return orig_method, run
+
+    def check_side_effects(self, method_dict, method_args):
+        if 'Static Fields Changed' in method_dict:
+            check(side_effect_is_correct(self.load(method_dict.get('Static Fields Changed'))), "static fields differ")
+        if method_args:
+            for arg_idx, arg_data in method_dict.get('Args Final', []):
+                arg = convert_to_python(self.load(arg_data), force_new_object=True)
+                check(recursive_equal(method_args[int(arg_idx)], arg), f"argument {arg_idx} differs")
+
+    def prepare(self):
+        """
+        Build the side effects of every patched method and the focal calls, in
+        workflow order. The original focal methods are looked up before anything
+        is patched, as generated tests do at import time.
+        """
+        for method_dict in self.mock_workflow:
+            method_name = method_dict.get("method_name", "")
+            is_constructor = method_name.endswith("<init>")
+            target = f"src.main.{patched_attribute_name(method_name, method_dict.get('modifier', ''))}"
+            if is_constructor:
+                target += ".__init__"
+            is_focal = method_dict.get("note", "") == "skip"
+            if is_focal and is_constructor:
+                side_effect, run = self.focal_constructor(method_dict)
+                self.focal_calls.append(run)
+            elif is_focal:
+                side_effect, run = self.focal_method(method_dict)
+                self.focal_calls.append(run)
+            elif is_constructor:
+                side_effect = self.constructor_side_effect(method_dict)
+            else:
+                side_effect = self.method_side_effect(method_dict)
+            self.add_side_effect(target, side_effect)
+
+    @instrumented("replay")
+    def run(self):
+        """
+        Replay the workflow.
+
+        Returns:
+            dict: "passed" (bool), "error" describing the first failed check or
+            unexpected exception, and for passing replays "peak_objects", the
+            largest number of objects held in the replay's ObjectArena.
+        """
+        try:
+            with ObjectArena() as arena, ExitStack() as patches:
+                self.prepare()
+                for target in self.patch_targets:
+                    mock = patches.enter_context(patch(target, autospec=True))
+                    mock.side_effect = SideEffect(*self.side_effects[target])
+                for run in self.focal_calls:
+                    run()
+                peak_size = arena.peak_size
+        except ReplayFailure as e:
+            return {"passed": False, "error": str(e)}
+        except Exception as e:
+            return {"passed": False, "error": f"{type(e).__name__}: {e}"}
+        return {"passed": True, "error": None, "peak_objects": peak_size}
+
+
+def replay_log(log_path, emit_failures=False, compress_fixtures=False, cache=None):
+    """
+    Replay every workflow of a test log.
+
+    Args:
+        log_path (str): Path to the test log file.
+        emit_failures (bool): Whether to write the decomposed test files (and their
+            fixture store) of the workflows that failed, as script.py would.
+        compress_fixtures (bool): Whether to gzip the emitted fixture store.
+        cache (ResultCache): If given, workflows whose inputs are unchanged since
+            a previous replay are not run again; their cached outcome is
+            reported, marked "cached".
+
+    Returns:
+        list: One result dict (see WorkflowReplay.run) per workflow, with its
+        "index" in the log and "focal_method".
+    """
+    payloads = PayloadTable()
+    results = []
+    failures = []
+    for i, mock_workflow in enumerate(parse_logs(log_path, payloads)):
+        focal_method = None
+        for method_mock in mock_workflow:
+            if method_mock.get("note", "") == "skip":
+                focal_method = method_mock.get("method_name", "")
+        result = None
+        if cache is not None:
+            key, modules = cache.key(mock_workflow, workflow_modules(mock_workflow))
+            result = cache.get(key)
+        if result is None:
+            result = WorkflowReplay(mock_workflow, payloads).run()
+            if cache is not None:
+                cache.put(key, result, modules)
+        result["index"] = i
+        result["focal_method"] = focal_method
+        results.append(result)
+        if not result["passed"]:
+            failures.append((i, mock_workflow))
+    if emit_failures and failures:
+        write_mock_tests(log_path, failures, payloads, compress_fixtures)
+    return results
+
+
+if __name__ == "__main__":
+    emit_failures = "--emit-failures" in sys.argv[1:]
+    compress_fixtures = "--gzip-fixtures" in sys.argv[1:]
+    cache = ResultCache() if "--cache" in sys.argv[1:] else None
+    if "--profile" in sys.argv[1:]:
+        enable()
+    log_files = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    passed = failed = cached = 0
+    for log_file in log_files:
+        with log_scope(log_file):
+            results = replay_log(log_file, emit_failures, compress_fixtures, cache)
+        for result in results:
+            name = f"{log_file}[{result['index']}] {result['focal_method']}"
+            if result.get("cached"):
+                cached += 1
+                name += " (cached)"
+            if result["passed"]:
+                passed += 1
+                print(f"PASSED {name}")
+            else:
+                failed += 1
+                print(f"FAILED {name}: {result['error']}")
+    if cache is not None:
+        cache.save()
+    print(f"{failed} failed, {passed} passed" + (f", {cached} cached" if cache is not None else ""))
+    sys.exit(1 if failed else 0)
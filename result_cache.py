@@ -0,0 +1,217 @@
+import ast
+import hashlib
+import json
+import os
+import sys
+
+from class_registry import build_index
+
+
+CACHE_FILE = ".mocker_result_cache.json"
+CACHE_VERSION = 1
+HARNESS_FILES = ("mock_helper.py", "replay.py", "log_parser.py", "type_registry.py", "class_registry.py")
+TYPE_MAP_FOLDER = "type_maps"
+
+
+def source_imports(file_path: str, module_name: str) -> list:
+    """
+    Return the names imported by a Python file, with relative imports resolved
+    against `module_name`. Names may be modules or attributes of modules.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            tree = ast.parse(file.read(), filename=file_path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    package = module_name if file_path.endswith("__init__.py") else module_name.rsplit(".", 1)[0]
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+                base = f"{parent}.{base}" if base else parent
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    return sorted(names)
+
+
+class ResultCache:
+    """
+    Outcomes of replayed workflows, keyed by the content of everything a replay
+    depends on: the workflow itself (whose payload keys are content hashes), the
+    source of the modules declaring its focal and patched classes together with
+    every `src` module they import transitively, and the replay helpers and
+    type maps.
+
+    Editing one translated class therefore only invalidates the workflows that
+    can reach it. The cache lives in `root`/.mocker_result_cache.json, along with
+    the digest and imports of every source file, reused while its mtime is
+    unchanged.
+
+    Args:
+        root (str): Project directory containing the `src` package.
+    """
+    def __init__(self, root=None):
+        self.root = root or os.getcwd()
+        self.path = os.path.join(self.root, CACHE_FILE)
+        try:
+            with open(self.path, "r") as file:
+                cached = json.load(file)
+            if cached.get("version") != CACHE_VERSION:
+                cached = {}
+        except (OSError, ValueError):
+            cached = {}
+        self.entries = cached.get("entries", {})
+        self.files = cached.get("files", {})
+        self.module_files = None
+        self.closures = {}
+        self.harness = None
+        self.changed = False
+
+    def load_modules(self):
+        if self.module_files is None:
+            self.module_files = {}
+            for rel_path, (mtime_ns, module_name, _) in build_index(self.root)["files"].items():
+                self.module_files[module_name] = (rel_path, mtime_ns)
+        return self.module_files
+
+    def file_info(self, module_name: str) -> list:
+        """
+        Return [mtime_ns, digest, imported src modules] for a module's file.
+        """
+        rel_path, mtime_ns = self.load_modules()[module_name]
+        info = self.files.get(rel_path)
+        if info is None or info[0] != mtime_ns:
+            file_path = os.path.join(self.root, rel_path)
+            with open(file_path, "rb") as file:
+                digest = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+            modules = self.load_modules()
+            imports = [name for name in source_imports(file_path, module_name) if name in modules]
+            info = [mtime_ns, digest, imports]
+            self.files[rel_path] = info
+            self.changed = True
+        return info
+
+    def closure(self, module_names) -> list:
+        """
+        Return the given modules, their enclosing packages and every module they
+        import transitively, sorted.
+        """
+        modules = self.load_modules()
+        seen = set()
+        pending = []
+        for module_name in module_names:
+            parts = module_name.split(".")
+            pending.extend(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+        while pending:
+            module_name = pending.pop()
+            if module_name in seen or module_name not in modules:
+                continue
+            seen.add(module_name)
+            pending.extend(self.file_info(module_name)[2])
+        return sorted(seen)
+
+    def harness_digest(self) -> str:
+        if self.harness is None:
+            digest = hashlib.blake2b(digest_size=16)
+            helper_folder = os.path.dirname(os.path.abspath(__file__))
+            type_map_folder = os.path.join(helper_folder, TYPE_MAP_FOLDER)
+            try:
+                shards = sorted(name for name in os.listdir(type_map_folder) if name.endswith(".json"))
+            except OSError:
+                shards = []
+            file_names = list(HARNESS_FILES) + [os.path.join(TYPE_MAP_FOLDER, name) for name in shards]
+            for file_name in file_names:
+                digest.update(f"\n{file_name}:".encode())
+                try:
+                    with open(os.path.join(helper_folder, file_name), "rb") as file:
+                        digest.update(file.read())
+                except OSError:
+                    pass
+            self.harness = digest.hexdigest()
+        return self.harness
+
+    def key(self, mock_workflow, module_names):
+        """
+        Compute the cache key of a workflow and the modules it depends on.
+
+        Args:
+            mock_workflow (list): Method dictionaries of the workflow.
+            module_names (iterable): Modules declaring the workflow's classes.
+
+        Returns:
+            tuple: (key, sorted names of every module the key covers).
+        """
+        closure_key = tuple(sorted(set(module_names)))
+        modules = self.closures.get(closure_key)
+        if modules is None:
+            modules = self.closure(closure_key)
+            self.closures[closure_key] = modules
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.harness_digest().encode())
+        digest.update(json.dumps(mock_workflow, sort_keys=True, default=str).encode())
+        for module_name in modules:
+            digest.update(f"\n{module_name}:{self.file_info(module_name)[1]}".encode())
+        return digest.hexdigest(), modules
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        result = dict(entry["result"])
+        result["cached"] = True
+        return result
+
+    def put(self, key, result, modules):
+        self.entries[key] = {"result": result, "modules": modules}
+        self.changed = True
+
+    def invalidate(self, module_name: str) -> int:
+        """
+        Drop the outcomes depending on a module or on any module of a package.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        prefix = module_name + "."
+        stale = [key for key, entry in self.entries.items()
+                 if any(name == module_name or name.startswith(prefix) for name in entry["modules"])]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.changed = True
+        return len(stale)
+
+    def clear(self):
+        self.entries = {}
+        self.changed = True
+
+    def save(self):
+        if not self.changed:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as file:
+                json.dump({"version": CACHE_VERSION, "entries": self.entries, "files": self.files}, file)
+            os.replace(tmp_path, self.path)
+            self.changed = False
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+if __name__ == "__main__":
+    cache = ResultCache()
+    if "--clear" in sys.argv[1:]:
+        cache.clear()
+        print("Cleared the result cache")
+    elif "--invalidate" in sys.argv[1:]:
+        for module_name in sys.argv[sys.argv.index("--invalidate") + 1:]:
+            print(f"{module_name}: {cache.invalidate(module_name)} cached outcomes dropped")
+    else:
+        print(f"usage: {sys.argv[0]} --clear | --invalidate MODULE...")
+        sys.exit(2)
+    cache.save()
@@ -1,153 +1,225 @@
 import os
 import sys
-import json
-from log_parser import parse_logs
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+from log_parser import parse_logs, PayloadTable
 from mock_helper import clear_reference_dict
+from fixture_store import FixtureWriter, FIXTURE_SUFFIX
+from instrumentation import instrumented, enable, log_scope
 
-def process_test_log(log_path, parse_logs):
+TEST_FILE_HEADER = (
+    "from unittest.mock import patch, MagicMock\n"
+    "from mock_helper import update_static_fields, set_object_instance_fields, convert_to_python, recursive_equal, side_effect_is_correct, clear_reference_dict\n"
+    "from fixture_store import load_fixture\n"
+    "from class_registry import resolve_class\n"
+    "import unittest, importlib, pkgutil, os, json, sys, inspect\n"
+    "import sys\n"
+    "import inspect\n"
+    "class SideEffect:\n"
+    "    def __init__(self, *fns):\n"
+    "        self.fs = iter(fns)\n"
+    "    def __call__(self, *args, **kwargs):\n"
+    "        f = next(self.fs)\n"
+    "        return None if f is None else f(*args, **kwargs)\n"
+)
+
+
+class MockTestBuilder:
+    """
+    Accumulates the parts of one generated mocker test (saved originals, @patch
+    targets, test parameters, side-effect functions and the focal-method body)
+    and renders the whole file once the workflow has been processed.
+
+    Args:
+        fixtures (FixtureWriter): Store receiving the payloads referenced by the test.
+        indentation_level (int): Indentation of `def test_mocking` inside MockTest.
+    """
+    def __init__(self, fixtures, indentation_level=4):
+        self.fixtures = fixtures
+        self.indentation_level = indentation_level
+        self.orig_lines = []
+        self.patch_targets = []
+        self.params = ["self"]
+        self.side_effects = {}
+        self.logic_blocks = []
+        self.body = []
+
+    def add_patch(self, target):
+        if target not in self.patch_targets:
+            self.patch_targets.append(target)
+
+    def add_param(self, param):
+        if param not in self.params:
+            self.params.append(param)
+
+    def fixture(self, payload_key):
+        """
+        Store a logged payload and return the expression loading it back.
+        """
+        key = self.fixtures.add(payload_key)
+        return f"load_fixture(FIXTURE_STORE, '{key}')"
+
+    def add_side_effect(self, mock_param, side_effect_name):
+        """
+        Register `side_effect_name` as the next call of `mock_param`.
+
+        Returns:
+            tuple: A placeholder for the `SideEffect(...)` assignment when this is
+            the first side effect of the mock, None otherwise.
+        """
+        if mock_param in self.side_effects:
+            self.side_effects[mock_param].append(side_effect_name)
+            return None
+        self.side_effects[mock_param] = [side_effect_name]
+        return ("side_effect", mock_param)
+
+    def render(self):
+        indent = " " * self.indentation_level
+        leading_spaces = " " * (self.indentation_level + 4)
+        fixture_file = os.path.basename(self.fixtures.path)
+        parts = [TEST_FILE_HEADER]
+        parts.append(f"FIXTURE_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '{fixture_file}')\n")
+        parts.extend(self.orig_lines)
+        parts.append("class MockTest(unittest.TestCase):\n")
+        for target in reversed(self.patch_targets):
+            parts.append(f"{indent}@patch('{target}', autospec=True)\n")
+        parts.append(f"{indent}def test_mocking({', '.join(self.params)}) -> None:\n")
+        # Side-effect functions of later mocks are defined first, as they always have been.
+        for block in reversed(self.logic_blocks):
+            for line in block:
+                if isinstance(line, tuple):
+                    mock_param = line[1]
+                    line = f"{leading_spaces}{mock_param}.side_effect = SideEffect({', '.join(self.side_effects[mock_param])})\n"
+                parts.append(line)
+        parts.append(f"{leading_spaces}# mocker test\n")
+        parts.extend(self.body)
+        return "".join(parts)
+
+
+@instrumented("process_test_log")
+def process_test_log(log_path, parse_logs, compress_fixtures=False):
     """
     Process a test log, mock methods, and save decomposed test files.
 
+    Serialized objects are not inlined into the tests; they go to one fixture
+    store per log, next to the generated tests, and are loaded by key at runtime.
+
     Args:
         log_path (str): Path to the test log file.
-        parse_logs (callable): Function to parse logs into a list of dictionaries.
+        parse_logs (callable): Function to parse logs into mock workflows, interning
+            payloads into the given PayloadTable.
+        compress_fixtures (bool): Whether to gzip the fixture store.
     """
-    test_name = log_path.split('.')[-2]
-    all_mock_workflows = parse_logs(log_path)
+    payloads = PayloadTable()
+    all_mock_workflows = parse_logs(log_path, payloads)
+    write_mock_tests(log_path, enumerate(all_mock_workflows), payloads, compress_fixtures)
 
+
+def write_mock_tests(log_path, indexed_workflows, payloads, compress_fixtures=False, append=False):
+    """
+    Save the decomposed test files of the given workflows of a test log, along
+    with the fixture store they load their payloads from.
+
+    Args:
+        log_path (str): Path to the test log file.
+        indexed_workflows (iterable): (index in the log, mock workflow) pairs; the
+            index is part of the test file name.
+        payloads (PayloadTable): Table the workflows' payload keys belong to.
+        compress_fixtures (bool): Whether to gzip the fixture store.
+        append (bool): Whether to add to the log's existing fixture store, for
+            workflows of a log that is processed in several parts.
+    """
+    test_name = log_path.split('.')[-2]
     test_path = log_path.replace('.', os.sep).rsplit(os.sep, 1)[0].rsplit(os.sep, 1)[0]
     os.makedirs(f'src{os.sep}test{os.sep}{os.sep.join(test_path.split(os.sep)[:-1])}', exist_ok=True)
+    fixture_path = f"src{os.sep}test{os.sep}{test_path}_{test_name}{FIXTURE_SUFFIX}"
+    if compress_fixtures:
+        fixture_path += ".gz"
 
-    for i, mock_workflow in enumerate(all_mock_workflows):
-        focal_method = None
-        for method_mock in mock_workflow:
-            if "note" in method_mock and method_mock.get("note", "") == "skip":
-                focal_method = method_mock.get("method_name", "")
-
-        # Create mocked version of the tests
-        focal_method = '_'.join(focal_method.split(".")[-2:])
-        mock_test_path = f"src{os.sep}test{os.sep}{test_path}_{test_name}_decomposed_mocker_{i}_{focal_method}.py"
-
-        with open(mock_test_path, 'w') as mock_test_file:
-            mock_test_file.write(
-                "from unittest.mock import patch, MagicMock\n"
-                "from mock_helper import update_static_fields, set_object_instance_fields, convert_to_python, recursive_equal, side_effect_is_correct, clear_reference_dict\n"
-                "import unittest, importlib, pkgutil, os, json, sys, inspect\n"
-                "import sys\n"
-                "import inspect\n"
-                "class SideEffect:\n"
-                "    def __init__(self, *fns):\n"
-                "        self.fs = iter(fns)\n"
-                "    def __call__(self, *args, **kwargs):\n"
-                "        f = next(self.fs)\n"
-                "        return None if f is None else f(*args, **kwargs)\n"
-                "def import_all_modules_from_folder(folder_path):\n"
-                "    relative_folder_path = folder_path.replace(os.sep, '.')\n"
-                "    folder_path = os.path.abspath(folder_path)\n"
-                "    parent_folder = os.path.dirname(folder_path)\n"
-                "    if parent_folder not in sys.path:\n"
-                "        sys.path.insert(0, parent_folder)\n"
-                "    for _, module_name, _ in pkgutil.walk_packages([folder_path], f\"{relative_folder_path}.\"):\n"
-                "        full_module_name = f\"{module_name}\"\n"
-                "        try:\n"
-                "            module = importlib.import_module(full_module_name)\n"
-                "            for name, obj in inspect.getmembers(module):\n"
-                "                if isinstance(obj, type) and 'src.main' in module_name:\n"
-                "                    globals()[f\"{module_name}.{name}\"] = obj\n"
-                "        except Exception as e:\n"
-                "            continue\n"
-                "import_all_modules_from_folder('src/main')\n"
-                "class MockTest(unittest.TestCase):\n"
-                "    def test_mocking(self) -> None:\n"
-                "        # mocker test\n"
-            )
-        clear_reference_dict_line_added = False
-        for method_mock in mock_workflow:
-            process_mocking(method_mock, mock_test_path, clear_reference_dict_line_added)
-            clear_reference_dict_line_added = True
+    with FixtureWriter(fixture_path, payloads, append) as fixtures:
+        for i, mock_workflow in indexed_workflows:
+            focal_method = None
+            for method_mock in mock_workflow:
+                if "note" in method_mock and method_mock.get("note", "") == "skip":
+                    focal_method = method_mock.get("method_name", "")
+
+            # Create mocked version of the tests
+            focal_method = '_'.join(focal_method.split(".")[-2:])
+            mock_test_path = f"src{os.sep}test{os.sep}{test_path}_{test_name}_decomposed_mocker_{i}_{focal_method}.py"
+
+            builder = MockTestBuilder(fixtures)
+            clear_reference_dict_line_added = False
+            for method_mock in mock_workflow:
+                process_mocking(method_mock, builder, clear_reference_dict_line_added)
+                clear_reference_dict_line_added = True
+            with open(mock_test_path, 'w') as mock_test_file:
+                mock_test_file.write(builder.render())
+
+
+def generate_mocked_method_name(method_name, modifier):
+    """Handle name mangling for private and protected methods."""
+    method_name_parts = method_name.rsplit('.', 1)
+    class_name, method = method_name_parts[0], method_name_parts[1]
+    if method == "type" or method == "next": # escape Python keyword
+        method += "_"
+    if "$" in class_name:
+        class_name = class_name.replace("$", '.')
+    else:
+        class_name += ('.' + class_name.rsplit('.', 1)[-1])
+    if modifier == "private":
+        return f"{class_name}._{class_name.split('.')[-1]}__{method}"
+    elif modifier == "protected":
+        return f"{class_name}._{method}"
+    else:
+        return f"{class_name}.{method}"
+
+
+def patched_attribute_name(method_name, modifier):
+    """
+    Return the name, relative to `src.main`, of what is patched for a logged
+    method: the class of a constructor (its `__init__` is patched) or the method.
+    """
+    if method_name.endswith("<init>"):
+        class_name = method_name.rsplit('.', 1)[0]
+        if "$" in class_name:
+            return class_name.replace("$", '.')
+        return class_name + ('.' + class_name.rsplit('.', 1)[1])
+    return generate_mocked_method_name(method_name, modifier)
 
 
-def process_mocking(method_dict, file_path, clear_reference_dict_line_added):
+@instrumented("process_mocking")
+def process_mocking(method_dict, builder, clear_reference_dict_line_added):
     """
     Add mocking logic for a specific method.
 
     Args:
         method_dict (dict): Method dictionary containing mocking details.
-        file_path (str): Path to the file being modified.
+        builder (MockTestBuilder): Test being generated for the current workflow.
         clear_reference_dict_line_added (bool): Whether `clear_reference_dict()` has been added to test code
     """
-    def generate_mocked_method_name(method_name, modifier):
-        """Handle name mangling for private and protected methods."""
-        method_name_parts = method_name.rsplit('.', 1)
-        class_name, method = method_name_parts[0], method_name_parts[1]
-        if method == "type" or method == "next": # escape Python keyword
-            method += "_"
-        if "$" in class_name:
-            class_name = class_name.replace("$", '.')
-        else:
-            class_name += ('.' + class_name.rsplit('.', 1)[-1])
-        if modifier == "private":
-            return f"{class_name}._{class_name.split('.')[-1]}__{method}"
-        elif modifier == "protected":
-            return f"{class_name}._{method}"
-        else:
-            return f"{class_name}.{method}"
-
     method_name = method_dict.get("method_name", "")
     occurrence_idx = method_dict.get("occurrence_idx", 0)
     is_constructor = method_name.endswith("<init>")
 
-    with open(file_path, 'r') as file:
-        lines = file.readlines()
+    indentation_level = builder.indentation_level
 
-    test_method_start = next((i for i, line in enumerate(lines) if f"def test_mocking" in line), None)
-    indentation_level = len(lines[test_method_start]) - len(lines[test_method_start].lstrip())
-    
-    # Insert @patch decorators before the test method
-    mock_decorators = []
+    # Register @patch decorators for the test method
+    patched_name = patched_attribute_name(method_name, method_dict.get("modifier", ""))
     if is_constructor:
-        class_name = method_name.rsplit('.', 1)[0]
-        if "$" in class_name:
-            patched_name = class_name.replace("$", '.')
-        else:
-            patched_name = class_name + ('.' + class_name.rsplit('.', 1)[1])
-        patch_line = next(
-                (i for i, line in enumerate(lines)
-                    if f"@patch('src.main.{patched_name}.__init__', autospec=True)" in line), None)
-        if not patch_line:
-            mock_decorators.extend([
-                " " * indentation_level + f"@patch('src.main.{patched_name}.__init__', autospec=True)\n"
-            ])
+        builder.add_patch(f"src.main.{patched_name}.__init__")
     else:
-        modifier = method_dict.get("modifier", "")
-        patched_name = generate_mocked_method_name(method_name, modifier)
-        patch_line = next(
-                (i for i, line in enumerate(lines)
-                    if f"@patch('src.main.{patched_name}', autospec=True)" in line), None)
-        if not patch_line:
-            mock_decorators.append(" " * indentation_level + f"@patch('src.main.{patched_name}', autospec=True)\n")
+        builder.add_patch(f"src.main.{patched_name}")
     unique_name = patched_name.replace(".", "_")
 
-    test_method_line = lines[test_method_start]
-    current_params = test_method_line[test_method_line.index("(") + 1:test_method_line.index(")")].split(",")
-    current_params = [p.strip() for p in current_params if p.strip()]
-
-    new_params = []
     class_name = method_name.rsplit('.', 1)[0].split('.')[-1].split("$")[-1]
     if is_constructor:
         mock_init = f"mock_{unique_name}_init".replace("$", "_")
-        if mock_init not in current_params:
-            new_params.append(mock_init)
+        builder.add_param(mock_init)
     else:
         mock_param = f"mock_{unique_name}".replace("$", "_")
-        if mock_param not in current_params:
-            new_params.append(mock_param)
-
-    updated_params = ", ".join(current_params + new_params)
-    lines[test_method_start] = test_method_line.replace(
-        f"({', '.join(current_params)})",
-        f"({updated_params})"
-    )
+        builder.add_param(mock_param)
+
     additional_logic = []
     method_body = []
     leading_spaces = " " * (indentation_level + 4)
@@ -156,26 +228,19 @@ def process_mocking(method_dict, file_path, clear_reference_dict_line_added):
     leading_spaces_inner_inner_inner = " " * (indentation_level + 4 * 4)
     
     if is_constructor:
-        init_side_effect_line = next(
-                (i for i, line in enumerate(lines[test_method_start:], start=test_method_start)
-                    if f"{leading_spaces}{mock_init}.side_effect = SideEffect" in line), None)
         class_name = method_name.rsplit('.', 1)[0].split('.')[-1].split("$")[-1]
         init_side_effect_name = f"{class_name}_init_side_effect_{occurrence_idx}".replace("$", "_")
         if "note" in method_dict and method_dict.get("note", "") == "skip":
             has_args = False
-            line_idx_before_test_class = next((i for i, line in enumerate(lines) if line.startswith(f"class MockTest")), None)
             lines_to_save_orig_constructor = []
             full_class_name = method_name.rsplit('.', 1)[0]
             if "$" in full_class_name:
                 full_class_name = full_class_name.replace("$", ".")
             else:
                 full_class_name = full_class_name + "." + class_name
-            lines_to_save_orig_constructor.append(f"{class_name}_clazz = globals().get('src.main.{full_class_name}')\n")
+            lines_to_save_orig_constructor.append(f"{class_name}_clazz = resolve_class('src.main.{full_class_name}')\n")
             lines_to_save_orig_constructor.append(f"orig_{class_name}_init = {class_name}_clazz.__init__\n")
-            lines[line_idx_before_test_class:line_idx_before_test_class] = lines_to_save_orig_constructor
-            test_method_start += 1
-            if init_side_effect_line:
-                init_side_effect_line += 1
+            builder.orig_lines.extend(lines_to_save_orig_constructor)
             orig_constructor = f"orig_{class_name}_init"
             additional_logic.append(
                 f"{leading_spaces}def {init_side_effect_name}(*args, **kwargs):\n"
@@ -186,45 +251,45 @@ def process_mocking(method_dict, file_path, clear_reference_dict_line_added):
                 f"{leading_spaces_inner_inner_inner}raise\n"
             )
             if 'Static Fields Initial' in method_dict:
-                global_fields_str = json.dumps(method_dict.get('Static Fields Initial'))
-                method_body.append(f"{leading_spaces}update_static_fields(json.loads({global_fields_str}))\n")
+                global_fields_str = builder.fixture(method_dict.get('Static Fields Initial'))
+                method_body.append(f"{leading_spaces}update_static_fields({global_fields_str})\n")
             if 'Args Initial' in method_dict:
                 method_body.append(f"{leading_spaces}method_args = []\n")
                 for arg_idx, arg_data in method_dict.get('Args Initial'):
                     has_args = True
-                    arg_data_str = json.dumps(arg_data)
-                    method_body.append(f"{leading_spaces}method_args.append(convert_to_python(json.loads({arg_data_str})))\n")
-            return_value_str = json.dumps(method_dict.get('Return value'))
-            method_body.append(f"{leading_spaces}clazz = globals().get('src.main.{full_class_name}')\n")
+                    arg_data_str = builder.fixture(arg_data)
+                    method_body.append(f"{leading_spaces}method_args.append(convert_to_python({arg_data_str}))\n")
+            return_value_str = builder.fixture(method_dict.get('Return value'))
+            method_body.append(f"{leading_spaces}clazz = resolve_class('src.main.{full_class_name}')\n")
             method_body.append(f"{leading_spaces}if issubclass(clazz, BaseException):\n")
             method_body.append(f"{leading_spaces_inner}obj = Exception.__new__(clazz)\n")
             method_body.append(f"{leading_spaces}else:\n")
             method_body.append(f"{leading_spaces_inner}obj = object.__new__(clazz)\n")
             if has_args:
                 if 'Exception thrown' in method_dict:
-                    exception_str = json.dumps(method_dict.get('Exception thrown'))
-                    method_body.append(f"{leading_spaces}e = convert_to_python(json.loads({exception_str}))\n")
+                    exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                    method_body.append(f"{leading_spaces}e = convert_to_python({exception_str})\n")
                     method_body.append(f"{leading_spaces}with self.assertRaises(type(e)):\n")
                     method_body.append(f"{leading_spaces_inner_inner}{orig_constructor}(obj, *method_args)\n")
                 else:
                     method_body.append(f"{leading_spaces}method_ret = {orig_constructor}(obj, *method_args)\n")
-                    method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(obj, convert_to_python(json.loads({return_value_str}), force_new_object=True)))\n")
+                    method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(obj, convert_to_python({return_value_str}, force_new_object=True)))\n")
             else:
                 if 'Exception thrown' in method_dict:
-                    exception_str = json.dumps(method_dict.get('Exception thrown'))
-                    method_body.append(f"{leading_spaces}e = convert_to_python(json.loads({exception_str}))\n")
+                    exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                    method_body.append(f"{leading_spaces}e = convert_to_python({exception_str})\n")
                     method_body.append(f"{leading_spaces}with self.assertRaises(type(e)):\n")
                     method_body.append(f"{leading_spaces_inner_inner}method_ret = {orig_constructor}(obj)\n")
                 else:
                     method_body.append(f"{leading_spaces}method_ret = {orig_constructor}(obj)\n")
-                    method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(obj, convert_to_python(json.loads({return_value_str}), force_new_object=True)))\n")
+                    method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(obj, convert_to_python({return_value_str}, force_new_object=True)))\n")
             if 'Static Fields Changed' in method_dict:
-                static_fields_changed_str = json.dumps(method_dict.get('Static Fields Changed'))
-                method_body.append(f"{leading_spaces}self.assertTrue(side_effect_is_correct(json.loads({static_fields_changed_str})))\n")
+                static_fields_changed_str = builder.fixture(method_dict.get('Static Fields Changed'))
+                method_body.append(f"{leading_spaces}self.assertTrue(side_effect_is_correct({static_fields_changed_str}))\n")
             if has_args and 'Args Final' in method_dict:
                 for arg_idx, arg_data in method_dict.get('Args Final'):
-                    arg_data_str = json.dumps(arg_data)
-                    method_body.append(f"{leading_spaces}arg_{arg_idx} = convert_to_python(json.loads({arg_data_str}), force_new_object=True)\n")
+                    arg_data_str = builder.fixture(arg_data)
+                    method_body.append(f"{leading_spaces}arg_{arg_idx} = convert_to_python({arg_data_str}, force_new_object=True)\n")
                     method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(method_args[{arg_idx}], arg_{arg_idx}))\n")
         else:
             additional_logic.append(
@@ -234,40 +299,32 @@ def process_mocking(method_dict, file_path, clear_reference_dict_line_added):
             )
             side_effects = False
             if 'Exception thrown' in method_dict:
-                exception_str = json.dumps(method_dict.get('Exception thrown'))
-                additional_logic.append(f"{leading_spaces_inner}raise convert_to_python(json.loads({exception_str}))\n")
+                exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                additional_logic.append(f"{leading_spaces_inner}raise convert_to_python({exception_str})\n")
                 side_effects = True
             if 'Static Fields Changed' in method_dict:
-                static_fields_changed_str = json.dumps(method_dict.get('Static Fields Changed'))
-                additional_logic.append(f"{leading_spaces_inner}update_static_fields(json.loads({static_fields_changed_str}))\n")
+                static_fields_changed_str = builder.fixture(method_dict.get('Static Fields Changed'))
+                additional_logic.append(f"{leading_spaces_inner}update_static_fields({static_fields_changed_str})\n")
                 side_effects = True
             if 'Args Final' in method_dict:
                 for arg_idx, arg_data in method_dict.get('Args Final'):
-                    arg_data_str = json.dumps(arg_data)
-                    additional_logic.append(f"{leading_spaces_inner}set_object_instance_fields(args[int({arg_idx}) + 1], json.loads({arg_data_str}))\n")
+                    arg_data_str = builder.fixture(arg_data)
+                    additional_logic.append(f"{leading_spaces_inner}set_object_instance_fields(args[int({arg_idx}) + 1], {arg_data_str})\n")
                 side_effects = True
             if 'Return value' in method_dict:
-                return_value_str = json.dumps(method_dict.get('Return value', '{}'))
-                additional_logic.append(f"{leading_spaces_inner}set_object_instance_fields(args[0], json.loads({return_value_str}))\n")
+                return_value_str = builder.fixture(method_dict.get('Return value'))
+                additional_logic.append(f"{leading_spaces_inner}set_object_instance_fields(args[0], {return_value_str})\n")
                 side_effects = True
-        if init_side_effect_line:
-            lines[init_side_effect_line] = lines[init_side_effect_line].replace(
-                ")", f", {init_side_effect_name})")
-        else:
-            additional_logic.append(
-                f"{leading_spaces}{mock_init}.side_effect = SideEffect({init_side_effect_name})\n"
-            )
+        side_effect_line = builder.add_side_effect(mock_init, init_side_effect_name)
+        if side_effect_line:
+            additional_logic.append(side_effect_line)
     else:
-        side_effect_line = next(
-            (i for i, line in enumerate(lines[test_method_start:], start=test_method_start)
-                if f"{leading_spaces}{mock_param}.side_effect = SideEffect" in line), None)
         name_base = method_name.split('.')[-1]
         if name_base == "type" or name_base == "next": # escape Python keyword
             name_base += "_"
         class_name = method_name.rsplit('.', 1)[0].split('.')[-1].split("$")[-1]
         if "note" in method_dict and method_dict.get("note", "") == "skip":
             has_args = False
-            line_idx_before_test_class = next((i for i, line in enumerate(lines) if line.startswith(f"class MockTest")), None)
             modifier = method_dict.get("modifier", "")
             lines_to_save_orig_method = []
             full_class_name = method_name.rsplit('.', 1)[0]
@@ -275,7 +332,7 @@ def process_mocking(method_dict, file_path, clear_reference_dict_line_added):
                 full_class_name = full_class_name.replace("$", ".")
             else:
                 full_class_name = full_class_name + "." + class_name
-            lines_to_save_orig_method.append(f"{class_name}_clazz = globals().get('src.main.{full_class_name}')\n")
+            lines_to_save_orig_method.append(f"{class_name}_clazz = resolve_class('src.main.{full_class_name}')\n")
             orig_method = f"orig_{class_name}_{name_base}"
             if modifier == "private":
                 lines_to_save_orig_method.append(f"{orig_method} = {class_name}_clazz._{class_name}__{name_base}\n")
@@ -284,79 +341,72 @@ def process_mocking(method_dict, file_path, clear_reference_dict_line_added):
             else:
                 lines_to_save_orig_method.append(f"{orig_method} = {class_name}_clazz.{name_base}\n")
             lines_to_save_orig_method.append(f"{class_name}_clazz.{orig_method} = {orig_method}\n")
-            lines[line_idx_before_test_class:line_idx_before_test_class] = lines_to_save_orig_method
-            test_method_start += 1
+            builder.orig_lines.extend(lines_to_save_orig_method)
+            side_effect_line = builder.add_side_effect(mock_param, orig_method)
             if side_effect_line:
-                side_effect_line += 1
-            if side_effect_line:
-                lines[side_effect_line] = lines[side_effect_line].replace(
-                    ")", f", orig_{class_name}_{name_base})")
-            else:
-                additional_logic.append(
-                    f"{leading_spaces}{mock_param}.side_effect = SideEffect(orig_{class_name}_{name_base})\n"
-                )
+                additional_logic.append(side_effect_line)
             if 'Static Fields Initial' in method_dict:
-                global_fields_str = json.dumps(method_dict.get('Static Fields Initial'))
-                method_body.append(f"{leading_spaces}update_static_fields(json.loads({global_fields_str}))\n")
+                global_fields_str = builder.fixture(method_dict.get('Static Fields Initial'))
+                method_body.append(f"{leading_spaces}update_static_fields({global_fields_str})\n")
             if 'Args Initial' in method_dict:
                 method_body.append(f"{leading_spaces}method_args = []\n")
                 for arg_idx, arg_data in method_dict.get('Args Initial'):
                     has_args = True
-                    arg_data_str = json.dumps(arg_data)
-                    method_body.append(f"{leading_spaces}method_args.append(convert_to_python(json.loads({arg_data_str})))\n")
+                    arg_data_str = builder.fixture(arg_data)
+                    method_body.append(f"{leading_spaces}method_args.append(convert_to_python({arg_data_str}))\n")
             instance_additional_str = ""
             if 'Instance Initial' in method_dict:
-                instance_initial_str = json.dumps(method_dict.get('Instance Initial'))
-                method_body.append(f"{leading_spaces}instance_initial = convert_to_python(json.loads({instance_initial_str}))\n")
+                instance_initial_str = builder.fixture(method_dict.get('Instance Initial'))
+                method_body.append(f"{leading_spaces}instance_initial = convert_to_python({instance_initial_str})\n")
                 instance_additional_str = f"instance_initial."
             if 'Return value' in method_dict:
-                return_value_str = json.dumps(method_dict.get('Return value'))
+                return_value_str = builder.fixture(method_dict.get('Return value'))
                 if has_args:
                     if 'Exception thrown' in method_dict:
-                        exception_str = json.dumps(method_dict.get('Exception thrown'))
-                        method_body.append(f"{leading_spaces}e = convert_to_python(json.loads({exception_str}))\n")
+                        exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                        method_body.append(f"{leading_spaces}e = convert_to_python({exception_str})\n")
                         method_body.append(f"{leading_spaces}with self.assertRaises(type(e)):\n")
                         method_body.append(f"{leading_spaces_inner_inner}method_ret = {instance_additional_str}{orig_method}(*method_args)\n")
                     else:
                         method_body.append(f"{leading_spaces}method_ret = {instance_additional_str}{orig_method}(*method_args)\n")
-                        method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(method_ret, convert_to_python(json.loads({return_value_str}), force_new_object=True)))\n")
+                        method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(method_ret, convert_to_python({return_value_str}, force_new_object=True)))\n")
                 else:
                     if 'Exception thrown' in method_dict:
-                        exception_str = json.dumps(method_dict.get('Exception thrown'))
-                        method_body.append(f"{leading_spaces}e = convert_to_python(json.loads({exception_str}))\n")
+                        exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                        method_body.append(f"{leading_spaces}e = convert_to_python({exception_str})\n")
                         method_body.append(f"{leading_spaces}with self.assertRaises(type(e)):\n")
                         method_body.append(f"{leading_spaces_inner_inner}method_ret = {instance_additional_str}{orig_method}()\n")
                     else:
                         method_body.append(f"{leading_spaces}method_ret = {instance_additional_str}{orig_method}()\n")
-                        method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(method_ret, convert_to_python(json.loads({return_value_str}), force_new_object=True)))\n")
+                        method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(method_ret, convert_to_python({return_value_str}, force_new_object=True)))\n")
             else:
                 if has_args:
                     if 'Exception thrown' in method_dict:
-                        exception_str = json.dumps(method_dict.get('Exception thrown'))
-                        method_body.append(f"{leading_spaces}e = convert_to_python(json.loads({exception_str}))\n")
+                        exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                        method_body.append(f"{leading_spaces}e = convert_to_python({exception_str})\n")
                         method_body.append(f"{leading_spaces}with self.assertRaises(type(e)):\n")
                         method_body.append(f"{leading_spaces_inner_inner}{instance_additional_str}{orig_method}(*method_args)\n")
                     else:
                         method_body.append(f"{leading_spaces}{instance_additional_str}{orig_method}(*method_args)\n")
                 else:
                     if 'Exception thrown' in method_dict:
-                        exception_str = json.dumps(method_dict.get('Exception thrown'))
-                        method_body.append(f"{leading_spaces}e = convert_to_python(json.loads({exception_str}))\n")
+                        exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                        method_body.append(f"{leading_spaces}e = convert_to_python({exception_str})\n")
                         method_body.append(f"{leading_spaces}with self.assertRaises(type(e)):\n")
                         method_body.append(f"{leading_spaces_inner_inner}{instance_additional_str}{orig_method}()\n")
                     else:
                         method_body.append(f"{leading_spaces}{instance_additional_str}{orig_method}()\n")
             if 'Instance Final' in method_dict:
-                instance_final_str = json.dumps(method_dict.get('Instance Final'))
-                method_body.append(f"{leading_spaces}instance_final = convert_to_python(json.loads({instance_final_str}), force_new_object=True)\n")
+                instance_final_str = builder.fixture(method_dict.get('Instance Final'))
+                method_body.append(f"{leading_spaces}instance_final = convert_to_python({instance_final_str}, force_new_object=True)\n")
                 method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(instance_initial, instance_final))\n")
             if 'Static Fields Changed' in method_dict:
-                static_fields_changed_str = json.dumps(method_dict.get('Static Fields Changed'))
-                method_body.append(f"{leading_spaces}self.assertTrue(side_effect_is_correct(json.loads({static_fields_changed_str})))\n")
+                static_fields_changed_str = builder.fixture(method_dict.get('Static Fields Changed'))
+                method_body.append(f"{leading_spaces}self.assertTrue(side_effect_is_correct({static_fields_changed_str}))\n")
             if has_args and 'Args Final' in method_dict:
                 for arg_idx, arg_data in method_dict.get('Args Final'):
-                    arg_data_str = json.dumps(arg_data)
-                    method_body.append(f"{leading_spaces}arg_{arg_idx} = convert_to_python(json.loads({arg_data_str}), force_new_object=True)\n")
+                    arg_data_str = builder.fixture(arg_data)
+                    method_body.append(f"{leading_spaces}arg_{arg_idx} = convert_to_python({arg_data_str}, force_new_object=True)\n")
                     method_body.append(f"{leading_spaces}self.assertTrue(recursive_equal(method_args[{arg_idx}], arg_{arg_idx}))\n")
         else:
             side_effect_name = f"{unique_name}_side_effect_{occurrence_idx}"
@@ -370,56 +420,138 @@ def process_mocking(method_dict, file_path, clear_reference_dict_line_added):
                 ]
             side_effects = False
             if 'Exception thrown' in method_dict:
-                exception_str = json.dumps(method_dict.get('Exception thrown'))
-                nested_logic.append(f"{leading_spaces_inner}raise convert_to_python(json.loads({exception_str}))\n")
+                exception_str = builder.fixture(method_dict.get('Exception thrown'))
+                nested_logic.append(f"{leading_spaces_inner}raise convert_to_python({exception_str})\n")
                 side_effects = True
             if 'Static Fields Changed' in method_dict:
-                static_fields_changed_str = json.dumps(method_dict.get('Static Fields Changed'))
-                nested_logic.append(f"{leading_spaces_inner}update_static_fields(json.loads({static_fields_changed_str}))\n")
+                static_fields_changed_str = builder.fixture(method_dict.get('Static Fields Changed'))
+                nested_logic.append(f"{leading_spaces_inner}update_static_fields({static_fields_changed_str})\n")
                 side_effects = True
             if 'Instance Final' in method_dict:
-                instance_final_str = json.dumps(method_dict.get('Instance Final'))
-                nested_logic.append(f"{leading_spaces_inner}set_object_instance_fields(self, json.loads({instance_final_str}))\n")
+                instance_final_str = builder.fixture(method_dict.get('Instance Final'))
+                nested_logic.append(f"{leading_spaces_inner}set_object_instance_fields(self, {instance_final_str})\n")
                 side_effects = True
             if 'Args Final' in method_dict:
                 for arg_idx, arg_data in method_dict.get('Args Final', []):
-                    arg_data_str = json.dumps(arg_data)
-                    nested_logic.append(f"{leading_spaces_inner}set_object_instance_fields(args[int({arg_idx})], json.loads({arg_data_str}))\n")
+                    arg_data_str = builder.fixture(arg_data)
+                    nested_logic.append(f"{leading_spaces_inner}set_object_instance_fields(args[int({arg_idx})], {arg_data_str})\n")
                 side_effects = True
             if 'Return value' in method_dict:
-                return_value_str = json.dumps(method_dict.get('Return value', '{}'))
-                nested_logic.append(f"{leading_spaces_inner}return convert_to_python(json.loads({return_value_str}))\n")
+                return_value_str = builder.fixture(method_dict.get('Return value'))
+                nested_logic.append(f"{leading_spaces_inner}return convert_to_python({return_value_str})\n")
                 side_effects = True
             if not side_effects:
                 nested_logic.append(f"{leading_spaces_inner}return None\n")
             additional_logic.extend(nested_logic)
+            side_effect_line = builder.add_side_effect(mock_param, side_effect_name)
             if side_effect_line:
-                lines[side_effect_line] = lines[side_effect_line].replace(
-                    ")", f", {side_effect_name})")
-            else:
-                additional_logic.append(
-                    f"{leading_spaces}{mock_param}.side_effect = SideEffect({side_effect_name})\n"
-                )
+                additional_logic.append(side_effect_line)
     if not clear_reference_dict_line_added:
         method_body.append(f"{leading_spaces}clear_reference_dict()")
-    patch_start = next((i for i, line in enumerate(lines) if f"@patch" in line), None)
-    new_test_method_start = next((i for i, line in enumerate(lines) if f"def test_mocking" in line), None)
-    if new_test_method_start is None:
-        new_test_method_start = next((i for i, line in enumerate(lines) if f"def testtest_mocking" in line), None)
-    if not patch_start:
-        lines[new_test_method_start:new_test_method_start] = mock_decorators
-    else:
-        lines[patch_start:patch_start] = mock_decorators
-    lines[new_test_method_start + len(mock_decorators) + 1:new_test_method_start + len(mock_decorators) + 1] = additional_logic
-    lines.extend(method_body)
-    with open(file_path, 'w') as file:
-        file.writelines(lines)
+    builder.logic_blocks.append(additional_logic)
+    builder.body.extend(method_body)
 
 
-if __name__ == "__main__":
+SERVE_JOBS = 2
+SERVE_TIMEOUT = 100
+
+
+def process_log_job(log_path, compress_fixtures):
     clear_reference_dict()
-    input_log_file = sys.argv[1]
-    result = process_test_log(input_log_file, parse_logs)
+    with log_scope(log_path):
+        process_test_log(log_path, parse_logs, compress_fixtures=compress_fixtures)
+
+
+def serve(input_stream, output_stream, jobs=SERVE_JOBS, timeout=SERVE_TIMEOUT, compress_fixtures=False):
+    """
+    Process the logs named on `input_stream`, one path per line, until an empty
+    line or end of input, writing one line per log to `output_stream`:
+    "OK <path>", "TIMEOUT <path>" or "ERROR <path> <exit code>", in completion order.
+    A log listed again while it is still being processed is processed once more
+    after that, with its own result line.
+
+    The modules are imported once, here; each log is then processed in a process
+    forked from this one, at most `jobs` at a time, and killed after `timeout`
+    seconds, as a single script.py run would be.
+
+    Args:
+        input_stream (file): Stream the log paths are read from.
+        output_stream (file): Stream the results are written to.
+        jobs (int): Maximum number of logs processed concurrently.
+        timeout (float): Seconds after which the processing of a log is killed.
+        compress_fixtures (bool): Whether to gzip the fixture stores.
+    """
+    context = multiprocessing.get_context("fork")
+    # no reader thread: a child forked while it holds the input's lock would hang
+    input_fd = input_stream.fileno()
+    buffer = b""
+    pending = []
+    running = {}
+    done_reading = False
+    while not done_reading or pending or running:
+        while len(running) < jobs:
+            # a log submitted again while it is being processed waits for that job: both would write the same files
+            log_path = next((log_path for log_path in pending if log_path not in running), None)
+            if log_path is None:
+                break
+            pending.remove(log_path)
+            process = context.Process(target=process_log_job, args=(log_path, compress_fixtures))
+            process.start()
+            running[log_path] = (process, time.monotonic() + timeout)
+
+        waiting = [process.sentinel for process, _ in running.values()]
+        if not done_reading:
+            waiting.append(input_fd)
+        next_deadline = min((deadline for _, deadline in running.values()), default=None)
+        wait(waiting, None if next_deadline is None else max(0, next_deadline - time.monotonic()))
+
+        if not done_reading and wait([input_fd], 0):
+            chunk = os.read(input_fd, 65536)
+            lines = (buffer + chunk).split(b"\n")
+            buffer = lines.pop()
+            if not chunk:
+                lines.append(buffer)
+                done_reading = True
+            for line in lines:
+                if not line.strip():
+                    done_reading = True
+                    break
+                pending.append(line.decode().strip())
+
+        for log_path, (process, deadline) in list(running.items()):
+            if process.exitcode is None and time.monotonic() < deadline:
+                continue
+            if process.exitcode is None:
+                process.kill()
+                result = f"TIMEOUT {log_path}"
+            elif process.exitcode == 0:
+                result = f"OK {log_path}"
+            else:
+                result = f"ERROR {log_path} {process.exitcode}"
+            process.join()
+            del running[log_path]
+            output_stream.write(result + "\n")
+            output_stream.flush()
+
+
+if __name__ == "__main__":
+    if "--profile" in sys.argv[1:]:
+        enable()
+    compress_fixtures = "--gzip-fixtures" in sys.argv[1:]
+    if "--serve" in sys.argv[1:]:
+        # python3 script.py --serve [--jobs N] [--timeout SECONDS], log paths on stdin
+        jobs = int(sys.argv[sys.argv.index("--jobs") + 1]) if "--jobs" in sys.argv else SERVE_JOBS
+        timeout = float(sys.argv[sys.argv.index("--timeout") + 1]) if "--timeout" in sys.argv else SERVE_TIMEOUT
+        # keep stdout for the results; anything the jobs print goes to stderr
+        results = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        serve(sys.stdin, results, jobs, timeout, compress_fixtures)
+        sys.exit(0)
+    log_files = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if len(log_files) != 1:
+        sys.exit("usage: python3 script.py [--profile] [--gzip-fixtures] <log file>\n"
+                 "       python3 script.py --serve [--jobs N] [--timeout SECONDS] [--gzip-fixtures]")
+    process_log_job(log_files[0], compress_fixtures)
 
 # /usr/libexec/java_home -V
 # export JAVA_HOME=`/usr/libexec/java_home -v 1.8`
@@ -0,0 +1,105 @@
+import json
+import os
+
+
+TYPE_MAP_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "type_maps")
+SHARD_INDEX_FILE = "index.json"
+BASE_SHARD = "java"
+SOURCE_PREFIXES = ("src.main.", "src.test.")
+
+
+def strip_source_prefix(name: str) -> str:
+    for prefix in SOURCE_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def conventional_python_type(java_type: str) -> str:
+    """
+    Derive the Python name of a translated class that has no type_map entry,
+    following the layout of the translated projects: each top-level class lives
+    in a module of its own name, and inner classes (`Outer$Inner`) are defined
+    at the top level of their outer class's module.
+
+    Args:
+        java_type (str): A "src.main."/"src.test." qualified Java class name.
+    """
+    package, _, class_name = java_type.rpartition(".")
+    outer_class = class_name.split("$")[0]
+    inner_class = class_name.split("$")[-1]
+    return f"{package}.{outer_class}.{inner_class}"
+
+
+class TypeMap:
+    """
+    Java -> Python type names, split into one JSON shard per translated project
+    (plus a shard for the JDK types shared by all of them) under `type_maps/`.
+
+    A shard is only read the first time a name from its project is looked up,
+    so only the project under test is ever loaded. `type_maps/index.json`
+    maps Java package prefixes to shard names; names matching no prefix
+    belong to the base shard.
+
+    Args:
+        folder (str): Directory holding the shard files and their index.
+    """
+    def __init__(self, folder=TYPE_MAP_FOLDER):
+        self.folder = folder
+        with open(os.path.join(folder, SHARD_INDEX_FILE), "r") as file:
+            self.shard_index = json.load(file)
+        self.loaded_shards = set()
+        self.types = {}
+        self.resolved = {}
+
+    def shard_for(self, name: str) -> str:
+        """
+        Return the shard holding `name`, matching the longest package prefix.
+        """
+        parts = strip_source_prefix(name).split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            shard = self.shard_index.get(".".join(parts[:i]))
+            if shard is not None:
+                return shard
+        return BASE_SHARD
+
+    def load_shard(self, shard: str):
+        if shard in self.loaded_shards:
+            return
+        with open(os.path.join(self.folder, f"{shard}.json"), "r") as file:
+            self.types.update(json.load(file))
+        self.loaded_shards.add(shard)
+
+    def get(self, name, default=None):
+        if not isinstance(name, str):
+            return default
+        self.load_shard(self.shard_for(name))
+        return self.types.get(name, default)
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __getitem__(self, name):
+        python_type = self.get(name)
+        if python_type is None:
+            raise KeyError(name)
+        return python_type
+
+    def resolve(self, java_type: str) -> str:
+        """
+        Return the Python type name to build for a logged Java type.
+
+        Unmapped translated classes fall back to the conventional module layout
+        rather than to the Java name itself; any other unmapped name is returned
+        as is. Results are memoized, so the `$` normalization runs once per type.
+        """
+        python_type = self.resolved.get(java_type)
+        if python_type is None:
+            python_type = self.get(java_type)
+            if python_type is None:
+                if java_type.startswith(SOURCE_PREFIXES):
+                    python_type = conventional_python_type(java_type)
+                else:
+                    python_type = java_type
+            self.resolved[java_type] = python_type
+        return python_type